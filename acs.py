@@ -11,9 +11,7 @@ import os.path
 import time
 import warnings
 import logging
-import pandas as pd
-import regex as re
-from parse import parse
+from functools import lru_cache
 
 DIR = os.path.dirname(os.path.realpath(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(DIR, os.pardir))
@@ -21,22 +19,42 @@ RES_DIR = os.path.join(ROOT_DIR, 'resources')
 SAVE_DIR = os.path.join(ROOT_DIR, 'save')
 REPOSITORY_DIR = os.path.join(SAVE_DIR, 'uscensus')
 REPORT_FILE = os.path.join(SAVE_DIR, 'uscensus', 'acs.csv')
+METADATA_DIR = os.path.join(SAVE_DIR, 'metadata', 'uscensus')
+INSTRUMENT_DIR = os.path.join(SAVE_DIR, 'instrument', 'uscensus')
+STORE_DIR = os.path.join(SAVE_DIR, 'parquet', 'uscensus')
+REFRESH_DIR = os.path.join(SAVE_DIR, 'refresh', 'uscensus')
 APIKEYS_FILE = os.path.join(RES_DIR, 'apikeys.txt')
 TABLES_FILE = os.path.join(DIR, 'tables.csv')
 if not ROOT_DIR in sys.path: sys.path.append(ROOT_DIR)
 
 from utilities.input import InputParser
-from utilities.dataframes import dataframe_fromfile, dataframe_parser
 from webscraping.webapi import WebURL, WebCache, WebQueue, WebDownloader
 from webscraping.webreaders import WebReader, Retrys
-from webscraping.webtimers import WebDelayer
 from webscraping.webpages import WebJsonPage, WebContents
 from webscraping.webdata import WebJson
 from webscraping.webvariables import Geography
+from uscensus.metadata import USCensus_MetadataCache
+from uscensus.instrument import INSTRUMENT
+from uscensus.delayers import USCensus_WebDelayer, USCensus_WebThrottle, RETRYCODES
+from uscensus.concurrency import USCensus_WebEngine
+from uscensus.geographys import geography_series
+from uscensus.datatypes import typed_parser
+from uscensus.brackets import bounds_parser
+from uscensus.storage import USCensus_WebStore
+from uscensus.streaming import USCensus_WebStream
+from uscensus.processing import USCensus_WebProcessor
+from uscensus.refresh import USCensus_WebManifest, USCensus_WebRefresh
+from uscensus.lazy import lazy_module
+
+np = lazy_module('numpy')
+pd = lazy_module('pandas')
+re = lazy_module('regex')
+parse = lazy_module('parse')
+dataframes = lazy_module('utilities.dataframes')
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ['USCensus_ACS_WebDelayer', 'USCensus_ACS_WebDownloader', 'USCensus_ACS_WebQueue']
+__all__ = ['USCensus_ACS_WebDelayer', 'USCensus_ACS_WebThrottle', 'USCensus_ACS_WebDownloader', 'USCensus_ACS_WebAsyncDownloader', 'USCensus_ACS_WebQueue']
 __copyright__ = "Copyright 2020, Jack Kirby Cook"
 __license__ = ""
 
@@ -45,10 +63,7 @@ LOGGER = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")    
 
 
-with open(APIKEYS_FILE) as file: APIKEYS = {line.split(',')[0]:line.split(',')[1] for line in file.readlines()}
-
-TABLES = dataframe_parser(dataframe_fromfile(TABLES_FILE, index='table', header=0), parsers={}, defaultparser=str)
-DATASETS = list(set(TABLES[['universe', 'index', 'header']].apply(lambda x: '_'.join([i for i in x if pd.notnull(i)]), axis=1).to_numpy()))
+LIMIT = 50
 VARIABLES = {
     'less than ${}':'<${}',  '${} to ${}':'${}|${}', '${} or more':'>${}', 'no chase rent':'$0', 
     'less than {} percent':'<{}%', '{} to {} percent':'{}%|{}%', '{} percent or more':'>{}%', 'not computed':'N/A',
@@ -73,22 +88,95 @@ _inverted = lambda x: {v:k for k, v in x.items()}
 _filter = lambda x: [i for i in x if i is not None]
 _range = lambda x: [str(i) for i in range(int(x.split('-')[0]), int(x.split('-')[1])+1)]
 _list = lambda x: [str(i) for i in str(x).split('|')]
+_bool = lambda x: str(x).lower() in ('true', 'yes', '1')
 _state = lambda x: str(x) if str(x) in STATES.values() else STATES[str(x)]
 _county = lambda x: ' '.join([str(x), 'County']) if not str(x).endswith(' County') else str(x)
 _tag = lambda *args: {'get':'{}'.format(','.join(list(args)))}
 _forgeo = lambda **kwargs: {'for':'{}'.format('%20'.join([':'.join([key, value]) for key, value in kwargs.items()]))} if kwargs else {}
 _ingeo = lambda **kwargs: {'in':'{}'.format('%20'.join([':'.join([key, value]) for key, value in kwargs.items()]))} if kwargs else {}
 _apikey = lambda apikey: {'key':'{}'.format(str(apikey))}
-    
-def _labels(string):
-    for key, value in VARIABLES.items():
-        if key == string: return value
-        content = parse(key, string)
-        if not content: continue
-        return value.format(*content.fixed)        
+_chunks = lambda x, size: [x[i:i+size] for i in range(0, len(x), size)]
+
+
+class USCensus_ACS_LabelCatalogue(object):
+    def __init__(self, tables, variables):
+        self.__patterns = {label:re.compile(label) for label in set(tables['label'].values) if isinstance(label, str)}
+        self.__templates = [(key, parse.compile(key), value) for key, value in variables.items()]
+        self.__labels = {}
+
+    def __getitem__(self, label): 
+        try: return self.__patterns[label]
+        except KeyError: return self.__patterns.setdefault(label, re.compile(label))
+
+    def __call__(self, label, variables):
+        return {key:self.label(label, value) for key, value in variables.items()}
+
+    def label(self, label, string):
+        try: return self.__labels[(label, string)]
+        except KeyError: return self.__labels.setdefault((label, string), self.relabel(self[label].findall(string)[0]))
+
+    def relabel(self, string):
+        for key, compiled, value in self.__templates:
+            if key == string: return value
+            content = compiled.parse(string)
+            if not content: continue
+            return value.format(*content.fixed)        
+
+    @staticmethod
+    def categorical(series, labels):
+        categories = list({value:None for value in labels.values() if value is not None}.keys())
+        lookup = np.array([categories.index(value) if value is not None else -1 for value in labels.values()] + [-1])
+        codes = pd.Categorical(series, categories=list(labels.keys())).codes
+        return pd.Categorical.from_codes(lookup[codes], categories=categories)
+
+
+@lru_cache(maxsize=None)
+def load_apikeys():
+    with open(APIKEYS_FILE) as file: return {line.split(',')[0]:line.split(',')[1] for line in file.readlines()}
+
+@lru_cache(maxsize=None)
+def load_tables(): return dataframes.dataframe_parser(dataframes.dataframe_fromfile(TABLES_FILE, index='table', header=0), parsers={}, defaultparser=str)
+
+@lru_cache(maxsize=None)
+def load_datasets(): return list({'_'.join([value for value in values if pd.notnull(value)]):None for values in load_tables()[['universe', 'index', 'header']].itertuples(index=False, name=None)}.keys())
+
+@lru_cache(maxsize=None)
+def load_labels(): return USCensus_ACS_LabelCatalogue(load_tables(), VARIABLES)
+
+@lru_cache(maxsize=None)
+def load_webcache():
+    class USCensus_ACS_WebCache(WebCache, querys=['table', 'date', 'geography', 'state', 'county'], datasets=load_datasets()): pass
+    USCensus_ACS_WebCache.__qualname__ = USCensus_ACS_WebCache.__name__
+    return USCensus_ACS_WebCache
+
+
+LAZY = {'APIKEYS':load_apikeys, 'TABLES':load_tables, 'DATASETS':load_datasets, 'LABELS':load_labels, 'USCensus_ACS_WebCache':load_webcache}
+
+def __getattr__(name):
+    try: return LAZY[name]()
+    except KeyError: raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
 def _tables(querys):
-    for query in querys: yield query, TABLES.loc[query['table'], :].squeeze().to_dict()
+    for query in querys: yield query, load_tables().loc[query['table'], :].squeeze().to_dict()
+
+def _plans(querys, batched=False):
+    plans, excluded = {}, ['table', 'county'] if batched else ['table']
+    for feedquery, tablequery in querys: 
+        key = tuple([(key, value) for key, value in feedquery.items() if key not in excluded])
+        plans[key] = plans.get(key, []) + [(feedquery, tablequery)]
+    for key, values in plans.items(): yield dict(key), values
+
+def _streams(querys, size):
+    tables, streams, stream, tags = {}, [], [], set()
+    for feedquery, tablequery, variables in querys: tables[tuple(variables.keys())] = tables.get(tuple(variables.keys()), []) + [(feedquery, tablequery, variables)]
+    for keys, values in tables.items():
+        if len(keys) > size:
+            count = -(-len(keys) // size)
+            streams.extend([[(feedquery, tablequery, {key:variables[key] for key in keys[index * len(keys) // count:(index + 1) * len(keys) // count]}) for feedquery, tablequery, variables in values] for index in range(count)])
+            continue
+        if stream and len(tags | set(keys)) > size: streams, stream, tags = streams + [stream], [], set()
+        stream, tags = stream + values, tags | set(keys)
+    return streams + ([stream] if stream else [])
 
 
 geography_xpath = lambda x: x['fips']
@@ -107,12 +195,13 @@ def geography_parser(x):
         except KeyError: required[key] = list(values)
     return required
     
-def vardata_parser(x): return pd.DataFrame(data=list(x)[1:], columns=list(x)[0])    
+def vardata_parser(x): 
+    rows = iter(x)
+    return pd.DataFrame.from_records(rows, columns=next(rows))
 def geodata_parser(x):
-    keys = tuple(list(x)[0][1:])
-    namesdata = [tuple(str(i[0]).split(', ')[::-1]) for i in list(x)[1:]]
-    valuesdata = [tuple(i[1:]) for i in list(x)[1:]]
-    return {(keys[-1], names[-1]):values[-1] for names, values in zip(namesdata, valuesdata)}
+    rows = iter(x)
+    key = next(rows)[-1]
+    return {(key, str(row[0]).split(', ')[0]):row[-1] for row in rows}
 
 
 class USCensus_WebGeography(WebJson.update(dataparser=geography_parser), xpath=geography_xpath): pass
@@ -121,8 +210,9 @@ class USCensus_WebGroups(WebJson.update(dataparser=variable_parser), xpath=group
 class USCensus_WebGeoData(WebJson.update(dataparser=geodata_parser), xpath=geodata_xpath): pass
 class USCensus_WebVarData(WebJson.update(dataparser=vardata_parser), xpath=vardata_xpath): pass
 
-class USCensus_ACS_WebDelayer(WebDelayer): pass
-class USCensus_ACS_WebReader(WebReader, retrys=Retrys(retries=3, backoff=0.3, httpcodes=(500, 502, 504)), authenticate=None): pass
+class USCensus_ACS_WebDelayer(USCensus_WebDelayer): pass
+class USCensus_ACS_WebThrottle(USCensus_WebThrottle): pass
+class USCensus_ACS_WebReader(WebReader, retrys=Retrys(retries=3, backoff=0.3, httpcodes=RETRYCODES), authenticate=None): pass
 
 
 class USCensus_ACSQuery_WebURL(WebURL, protocol='https', domain='api.census.gov'): 
@@ -146,32 +236,47 @@ class USCensus_ACS_WebContents(WebContents):
 
 
 class USCensus_ACS_WebPage(WebJsonPage, contents=USCensus_ACS_WebContents):
+    def __init__(self, *args, delayer, **kwargs):
+        super().__init__(*args, delayer=delayer, **kwargs)
+        self.__delayer = delayer
+
+    def request(self, url, *args, **kwargs):
+        with INSTRUMENT('transfer'): webpage = self.__delayer.attempt(self.load, url, *args, referer=None, **kwargs)
+        with INSTRUMENT('parse'): return webpage.setup()
+
     def setup(self, *args, **kwargs): 
         for content in iter(self.load): content(*args, **kwargs)
         if self.empty: self.show()
     
-    def execute(self, *args, table, universe, index, header, scope, date, geography, **kwargs): 
+    def execute(self, *args, **kwargs): 
+        dataframe = self[USCensus_ACS_WebContents.VARDATA].data()
+        yield self.reshape(dataframe, *args, **kwargs)
+
+    @classmethod
+    def reshape(cls, dataframe, *args, table, universe, index, header, scope, date, geography, variables, typed=False, brackets=False, **kwargs):
         query = {'table':table, 'date':date, 'geography':geography, **{key:value for key, value in kwargs.items() if key in GEOGRAPHYS.keys()}}
         dataset = '{}_{}_{}'.format(universe, index, header)
         dataset = dataset if not str(dataset).endswith('_') else dataset[:-1]
-        dataframe = self[USCensus_ACS_WebContents.VARDATA].data()
-        dataframe = self.variables(dataframe, *args, universe=universe, index=index, header=header, **kwargs)
-        dataframe = self.geography(dataframe, *args, **kwargs)
+        if typed:
+            with INSTRUMENT('typed', rows=len(dataframe)): dataframe = typed_parser(dataframe, numerics=list(variables.keys()), categoricals=[column for column in dataframe.columns if column in GEOGRAPHYS.values()])
+        with INSTRUMENT('geography', rows=len(dataframe)): dataframe = cls.geography(dataframe, *args, **kwargs)
+        with INSTRUMENT('variables', rows=len(dataframe)): dataframe = cls.variables(dataframe, *args, variables=variables, universe=universe, index=index, header=header, brackets=brackets, **kwargs)
         dataframe['date'] = date
         dataframe['scope'] = scope
-        if pd.notnull(header): dataframe = dataframe[[universe, index, header, 'scope', 'date']]
+        if typed: dataframe = typed_parser(dataframe, categoricals=['geography', 'scope', 'date'])
+        if pd.notnull(header) and brackets: dataframe = dataframe[[universe, index, header, '{}_lower'.format(header), '{}_upper'.format(header), 'scope', 'date']]
+        elif pd.notnull(header): dataframe = dataframe[[universe, index, header, 'scope', 'date']]
         else: dataframe = dataframe[[universe, index, 'scope', 'date']]
-        yield query, dataset, dataframe
+        return query, dataset, dataframe
 
     @staticmethod
     def geography(dataframe, *args, **kwargs):
         geokeys = [column for column in dataframe.columns if column in GEOGRAPHYS.values()]
-        function = lambda x: str(Geography(keys=list(geokeys), names=x.to_dict()['NAME'].split(', ')[::-1], values=[x.to_dict()[geokey] for geokey in geokeys]))
-        dataframe['geography'] = dataframe.apply(function, result_type='reduce', axis=1)
+        dataframe['geography'] = geography_series(dataframe, keys=geokeys, names='NAME', values=geokeys)
         return dataframe
     
     @staticmethod
-    def variables(dataframe, *args, variables, label, universe, index, header, **kwargs):
+    def variables(dataframe, *args, variables, label, universe, index, header, brackets=False, **kwargs):
         idVars = [column for column in dataframe.columns if column not in variables.keys()]
         valVars = list(variables.keys())
         if pd.isnull(header): 
@@ -181,15 +286,13 @@ class USCensus_ACS_WebPage(WebJsonPage, contents=USCensus_ACS_WebContents):
         else: 
             assert len(valVars) > 1
             dataframe = dataframe.melt(id_vars=idVars, value_vars=valVars, var_name=header, value_name=universe, ignore_index=True)
-            function = lambda x: re.findall(label, variables[x])[0]
-            dataframe[header] = dataframe[header].apply(function)
-            dataframe[header] = dataframe[header].apply(_labels)
+            dataframe[header] = load_labels().categorical(dataframe[header], load_labels()(label, variables))
+            if brackets: dataframe['{}_lower'.format(header)], dataframe['{}_upper'.format(header)] = bounds_parser(dataframe[header])
             return dataframe
 
 
-class USCensus_ACS_WebCache(WebCache, querys=['table', 'date', 'geography', 'state', 'county'], datasets=DATASETS): pass
 class USCensus_ACS_WebQueue(WebQueue, querys=['table', 'date', 'geography', 'state', 'county']): 
-    def table(self, *args, table, **kwargs): return [str(table)]    
+    def table(self, *args, table=None, tables=[], **kwargs): return [str(item) for item in [table, *tables] if item]
     def date(self, *args, date=None, dates=[], **kwargs): return [str(item) for item in [date, *dates] if item]
     def geography(self, *args, geography, **kwargs): return [str(geography)]
     def state(self, *args, state, **kwargs): return [_state(state)]
@@ -197,54 +300,180 @@ class USCensus_ACS_WebQueue(WebQueue, querys=['table', 'date', 'geography', 'sta
 
 
 class USCensus_ACS_WebDownloader(WebDownloader, delay=25, attempts=10): 
-    def execute(self, *args, queue, delayer, **kwargs):
-        with USCensus_ACS_WebReader() as session:
+    def execute(self, *args, queue, delayer, metadata, store=None, batched=False, typed=False, brackets=False, streaming=False, processes=None, refresh=None, **kwargs):
+        if streaming and store is None: raise ValueError('Streaming requires a store to write into')
+        if streaming and processes: raise ValueError('Streaming and processes are exclusive')
+        if refresh is not None and (streaming or processes): raise ValueError('Refresh is exclusive with streaming and processes')
+        with USCensus_ACS_WebReader() as session, USCensus_WebStream(delayer=delayer) as webstream, USCensus_WebProcessor(processes=processes) as webprocessor:
             webpage = USCensus_ACS_WebPage(session, delayer=delayer) 
-            for feedquery, tablequery in _tables(iter(queue)):
-                geography = self.geography(webpage, **feedquery)
-                geography[feedquery['geography']] = {'name':None, 'value': None}
-                variables = self.variables(webpage, **tablequery, **feedquery)
-                url = USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME', *list(variables.keys())], geography=geography, date=feedquery['date'], apikey=APIKEYS['uscensus'])
-                webpage.load(url, referer=None).setup()
-                for query, dataset, dataframe in webpage(variables=variables, **feedquery, **tablequery): yield USCensus_ACS_WebCache(query, {dataset:dataframe})
-
-    def geography(self, webpage, *args, date, **kwargs):
+            if refresh is not None:
+                with refresh:
+                    for plan in _plans(_tables(iter(queue)), batched=batched):
+                        with INSTRUMENT.querying(plan[0]):
+                            for webcache in self.refresh(webpage, refresh, plan, metadata=metadata, store=store, batched=batched, typed=typed, brackets=brackets):
+                                with INSTRUMENT('write'): yield webcache
+                return
+            if processes:
+                for webcache in self.process(webpage, webprocessor, _plans(_tables(iter(queue)), batched=batched), metadata=metadata, store=store, batched=batched, typed=typed, brackets=brackets):
+                    with INSTRUMENT('write'): yield webcache
+                return
+            for plan in _plans(_tables(iter(queue)), batched=batched):
+                with INSTRUMENT.querying(plan[0]):
+                    if streaming: webcaches = self.stream(webpage, webstream, plan, metadata=metadata, store=store, batched=batched, typed=typed, brackets=brackets)
+                    else: webcaches = self.split(self.fetch(webpage, plan, metadata=metadata, batched=batched), store=store, typed=typed, brackets=brackets)
+                    for webcache in webcaches:
+                        with INSTRUMENT('write'): yield webcache
+
+    def prepare(self, webpage, plan, *args, metadata, batched=False, **kwargs):
+        planquery, querys = plan
+        countys = list({feedquery['county']:None for feedquery, tablequery in querys if feedquery.get('county', None)}.keys()) if batched else []
+        geography, fipscodes = self.geography(webpage, metadata, **planquery, **({'county':None, 'countys':countys} if countys else {}))
+        geography[planquery['geography']] = {'name':None, 'value': None}
+        querys = [(feedquery, tablequery, self.variables(webpage, metadata, **tablequery, **feedquery)) for feedquery, tablequery in querys]
+        return geography, fipscodes, querys
+
+    def fetch(self, webpage, plan, *args, metadata, batched=False, **kwargs):
+        geography, fipscodes, querys = self.prepare(webpage, plan, metadata=metadata, batched=batched)
+        dataframe = self.download(webpage, geography=geography, variables=[variables for feedquery, tablequery, variables in querys], date=plan[0]['date'])
+        return dataframe, fipscodes, querys
+
+    def stream(self, webpage, webstream, plan, *args, metadata, store, batched=False, typed=False, brackets=False, **kwargs):
+        geography, fipscodes, querys = self.prepare(webpage, plan, metadata=metadata, batched=batched)
+        results = {}
+        for index, streamed in enumerate(_streams(querys, LIMIT - 1)):
+            tags = list({key:None for feedquery, tablequery, variables in streamed for key in variables.keys()}.keys())
+            url = USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME', *tags], geography=geography, date=plan[0]['date'], apikey=load_apikeys()['uscensus'])
+            for part, batch in enumerate(webstream(url)):
+                for query, dataset, dataframe in self.partitions((batch, fipscodes, streamed), store=store, typed=typed, brackets=brackets, part=(index, part)): 
+                    results[tuple(query.items())] = (query, dataset, dataframe.iloc[0:0])
+        for query, dataset, dataframe in results.values(): yield load_webcache()(query, {dataset:dataframe})
+
+    def refresh(self, webpage, webrefresh, plan, *args, metadata, store=None, batched=False, typed=False, brackets=False, **kwargs):
+        geography, fipscodes, querys = self.prepare(webpage, plan, metadata=metadata, batched=batched)
+        dataframe, payloads = self.conditional(webrefresh, geography=geography, variables=[variables for feedquery, tablequery, variables in querys], date=plan[0]['date'])
+        if dataframe is None:
+            for feedquery, tablequery, variables in querys: webrefresh.skip(feedquery)
+            webrefresh.commit(payloads)
+            return
+        for query, dataset, results in self.partitions((dataframe, fipscodes, querys), store=store, typed=typed, brackets=brackets):
+            webrefresh.change(query, dataset, file=store.file(query, dataset) if store is not None else None)
+            yield load_webcache()(query, {dataset:results})
+        webrefresh.commit(payloads)
+
+    def split(self, contents, *args, store=None, typed=False, brackets=False, **kwargs):
+        for query, dataset, dataframe in self.partitions(contents, store=store, typed=typed, brackets=brackets): yield load_webcache()(query, {dataset:dataframe})
+
+    def process(self, webpage, webprocessor, plans, *args, metadata, store=None, batched=False, typed=False, brackets=False, **kwargs):
+        tasks = ((None, dataframe, parameters) for plan in plans for dataframe, parameters in self.tasks(self.fetch(webpage, plan, metadata=metadata, batched=batched), typed=typed, brackets=brackets))
+        for part, (query, dataset, dataframe) in webprocessor(USCensus_ACS_WebPage.reshape, tasks):
+            if store is not None and not dataframe.empty: store.append(query, dataset, dataframe, part=part)
+            yield load_webcache()(query, {dataset:dataframe})
+
+    def partitions(self, contents, *args, store=None, typed=False, brackets=False, part=None, **kwargs):
+        for dataframe, parameters in self.tasks(contents, typed=typed, brackets=brackets):
+            query, dataset, results = USCensus_ACS_WebPage.reshape(dataframe, **parameters)
+            if store is not None and not results.empty: store.append(query, dataset, results, part=part)
+            yield query, dataset, results
+
+    def tasks(self, contents, *args, typed=False, brackets=False, **kwargs):
+        dataframe, fipscodes, querys = contents
+        dataframes = {fipscode:dataframe[dataframe['county'] == fipscode] for fipscode in fipscodes.values()} if fipscodes else {}
+        tags = [key for feedquery, tablequery, variables in querys for key in variables.keys()]
+        for feedquery, tablequery, variables in querys:
+            results = dataframes[fipscodes[feedquery['county']]] if fipscodes else dataframe
+            columns = [column for column in results.columns if column not in tags] + list(variables.keys())
+            yield results[columns].copy(), dict(variables=variables, typed=typed, brackets=brackets, **feedquery, **tablequery)
+
+    def download(self, webpage, *args, geography, variables, date, **kwargs):
+        tags = list({key:None for items in variables for key in items.keys()}.keys())
+        dataframes = []
+        for chunk in _chunks(tags, LIMIT - 1):
+            url = USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME', *chunk], geography=geography, date=date, apikey=load_apikeys()['uscensus'])
+            dataframes.append(webpage.request(url)[USCensus_ACS_WebContents.VARDATA].data())
+        dataframe = dataframes[0]
+        for other in dataframes[1:]: dataframe = dataframe.merge(other, how='outer', on=[column for column in dataframe.columns if column not in tags])
+        return dataframe
+
+    def conditional(self, webrefresh, *args, geography, variables, date, **kwargs):
+        tags = list({key:None for items in variables for key in items.keys()}.keys())
+        urls = [USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME', *chunk], geography=geography, date=date, apikey=load_apikeys()['uscensus']) for chunk in _chunks(tags, LIMIT - 1)]
+        payloads = [webrefresh(url) for url in urls]
+        if not any([changed for key, entry, contents, changed in payloads]): return None, payloads
+        payloads = [webrefresh(url, force=True) if payload[2] is None else payload for url, payload in zip(urls, payloads)]
+        dataframes = [vardata_parser(webrefresh.load(contents)) for key, entry, contents, changed in payloads]
+        dataframe = dataframes[0]
+        for other in dataframes[1:]: dataframe = dataframe.merge(other, how='outer', on=[column for column in dataframe.columns if column not in tags])
+        return dataframe, payloads
+
+    def geography(self, webpage, metadata, *args, date, countys=[], **kwargs):
         url = USCensus_ACSQuery_WebURL(dataset='acs5', date=date, query='geography')
-        orders = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GEOGRAPHY].data()
+        orders = metadata(date, 'geography', function=lambda: webpage.request(url)[USCensus_ACS_WebContents.GEOGRAPHY].data())
         orders = {_inverted(GEOGRAPHYS)[key]:[_inverted(GEOGRAPHYS)[value] for value in values if value in GEOGRAPHYS.values()] for key, values in orders.items() if key in GEOGRAPHYS.values()}
         orders = [[value for value in values if value in kwargs.keys()] + [key] for key, values in orders.items() if key in kwargs.keys()]
         order = max(orders, key=lambda x: len(x))
-        geography = Geography(keys=order)
+        geography, fipscodes = Geography(keys=order), {}
         for index, key in enumerate(order, start=1):
-            url = USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME'], geography=geography[0:index], date=date, apikey=APIKEYS['uscensus'])   
-            geovalues = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GEODATA].data() 
-            geography[key] = dict(name=kwargs[key], value=geovalues[(key, kwargs[key])])            
-        return geography
-
-    def variables(self, webpage, *args, date, group, label, **kwargs):
+            geovalues = self.geovalues(webpage, metadata, geography[0:index], date=date)
+            if key == 'county' and bool(countys): 
+                assert key == order[-1]
+                fipscodes = {county:geovalues[(key, county)] for county in countys}
+                geography[key] = dict(name=None, value=None)
+            else: geography[key] = dict(name=kwargs[key], value=geovalues[(key, kwargs[key])])            
+        return geography, fipscodes
+
+    def geovalues(self, webpage, metadata, geography, *args, date, **kwargs):
+        url = USCensus_ACSData_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=load_apikeys()['uscensus'])   
+        return metadata(date, 'NAME', str(geography), function=lambda: webpage.request(url)[USCensus_ACS_WebContents.GEODATA].data())
+
+    def variables(self, webpage, metadata, *args, date, group, label, **kwargs):
         url = USCensus_ACSQuery_WebURL(dataset='acs5', date=date, query='group', group=group)
-        variables = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GROUPS].data()
-        variables = {key:value for key, value in variables.items() if re.findall(label, value)} 
+        variables = metadata(date, 'groups/{}'.format(group), function=lambda: webpage.request(url)[USCensus_ACS_WebContents.GROUPS].data())
+        variables = {key:value for key, value in variables.items() if load_labels()[label].findall(value)} 
         return variables
                                
 
-def main(*args, **kwargs): 
-    webdelayer = USCensus_ACS_WebDelayer('constant', wait=15)
-    webqueue = USCensus_ACS_WebQueue(REPORT_FILE, *args, **kwargs)
-    webdownloader = USCensus_ACS_WebDownloader(REPOSITORY_DIR, REPORT_FILE, *args, queue=webqueue, delayer=webdelayer, **kwargs)
+class USCensus_ACS_WebAsyncDownloader(USCensus_ACS_WebDownloader, delay=25, attempts=10):
+    def execute(self, *args, queue, delayer, metadata, store=None, batched=False, typed=False, brackets=False, concurrency=4, streaming=False, processes=None, **kwargs):
+        if streaming or processes: raise ValueError('Concurrency is exclusive with streaming and processes')
+        webengine = USCensus_WebEngine(USCensus_ACS_WebReader, USCensus_ACS_WebPage, delayer=delayer, concurrency=concurrency)
+        def fetch(webpage, plan):
+            with INSTRUMENT.querying(plan[0]): return plan[0], self.fetch(webpage, plan, metadata=metadata, batched=batched)
+        def split(contents):
+            with INSTRUMENT.querying(contents[0], tag=True): return list(self.split(contents[1], store=store, typed=typed, brackets=brackets))
+        for webcache in webengine(fetch, split, _plans(_tables(iter(queue)), batched=batched)):
+            with INSTRUMENT('write'): yield webcache
+
+
+def main(*args, rate=None, concurrency=None, parquet=False, instrument=False, profile=None, refresh=False, **kwargs): 
+    if refresh and concurrency: raise ValueError('Refresh and concurrency are exclusive')
+    if concurrency and (kwargs.get('streaming', False) or kwargs.get('processes', None)): raise ValueError('Concurrency is exclusive with streaming and processes')
+    if concurrency and not rate: raise ValueError('Concurrency requires a rate to share across its fetchers')
+    if instrument or profile is not None: INSTRUMENT.configure(file=os.path.join(INSTRUMENT_DIR, 'acs_{}.json'.format(time.strftime('%Y%m%d%H%M%S'))), profile=profile)
+    webdelayer = USCensus_ACS_WebThrottle(rate=rate, burst=5) if rate else USCensus_ACS_WebDelayer('constant', wait=15)
+    webmetadata = USCensus_MetadataCache(METADATA_DIR, size=256)
+    webstore = USCensus_WebStore(STORE_DIR, integers=list(load_tables()['universe'].dropna().unique()), floats=['{}_{}'.format(header, bound) for header in load_tables()['header'].dropna().unique() for bound in ('lower', 'upper')]) if parquet else None
+    webrefresh = USCensus_WebRefresh(USCensus_WebManifest(os.path.join(REFRESH_DIR, 'acs.json')), delayer=webdelayer) if refresh else None
+    reportfile = os.path.join(REFRESH_DIR, 'acs_{}.csv'.format(time.strftime('%Y%m%d'))) if refresh else REPORT_FILE
+    webqueue = USCensus_ACS_WebQueue(reportfile, *args, **kwargs)
+    if concurrency: webdownloader = USCensus_ACS_WebAsyncDownloader(REPOSITORY_DIR, reportfile, *args, queue=webqueue, delayer=webdelayer, metadata=webmetadata, store=webstore, concurrency=concurrency, **kwargs)
+    else: webdownloader = USCensus_ACS_WebDownloader(REPOSITORY_DIR, reportfile, *args, queue=webqueue, delayer=webdelayer, metadata=webmetadata, store=webstore, refresh=webrefresh, **kwargs)
     webdownloader(*args, **kwargs)
     while True: 
         if webdownloader.off: break
         if webdownloader.error: break
         time.sleep(15)
     LOGGER.info(str(webdownloader))
+    LOGGER.info(str(webmetadata))
+    LOGGER.info(str(webdelayer))
+    INSTRUMENT.dump()
+    if webrefresh is not None: webrefresh.report(os.path.join(REFRESH_DIR, 'acs_{}.json'.format(time.strftime('%Y%m%d%H%M%S'))))
     for results in webdownloader.results: print(str(results))
     if not bool(webdownloader): raise webdownloader.error
 
 
 if __name__ == '__main__':    
     logging.basicConfig(level='INFO', format="[%(levelname)s, %(threadName)s]:  %(message)s")
-    inputparser = InputParser(proxys={'assign':'=', 'space':'_'}, parsers={'dates':_range, 'countys':_list}, default=str)   
+    inputparser = InputParser(proxys={'assign':'=', 'space':'_'}, parsers={'dates':_range, 'tables':_list, 'countys':_list, 'batched':_bool, 'typed':_bool, 'parquet':_bool, 'streaming':_bool, 'rate':float, 'concurrency':int, 'instrument':_bool, 'profile':int, 'processes':int, 'refresh':_bool, 'brackets':_bool}, default=str)   
     inputparser(*sys.argv[1:])
     main(*inputparser.inputArgs, **inputparser.inputParms)  
     
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Benchmarks
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import time
+import json
+import hashlib
+import types
+import tempfile
+import resource
+import threading
+import subprocess
+import itertools
+import logging
+import tracemalloc
+import multiprocessing
+import requests
+import numpy as np
+import pandas as pd
+import regex as re
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlsplit, parse_qsl, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(DIR, os.pardir))
+if not ROOT_DIR in sys.path: sys.path.append(ROOT_DIR)
+
+from utilities.input import InputParser
+from webscraping.webvariables import Geography
+from uscensus.metadata import USCensus_MetadataCache
+from uscensus.delayers import USCensus_WebDelayer, USCensus_WebThrottle
+from uscensus.geographys import geography_series
+from uscensus.datatypes import typed_parser
+from uscensus.instrument import USCensus_WebInstrument
+from uscensus.brackets import USCensus_BracketDistribution, bracket_parser
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_StubUniverse', 'USCensus_StubServer']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+GEOFILTERS = re.compile(r'\s*([^:]+?):(\S+)')
+LEVELS = {'state':'state', 'county':'county', 'subdivision':'county subdivision', 'tract':'tract', 'block':'block group'}
+HIERARCHY = {'state':[], 'county':['state'], 'county subdivision':['state', 'county'], 'tract':['state', 'county'], 'block group':['state', 'county', 'tract']}
+SIZES = {
+    'state':{'geography':'county', 'states':1, 'countys':60, 'subdivisions':3, 'tracts':25, 'blocks':3},
+    'county':{'geography':'tract', 'states':1, 'countys':1, 'subdivisions':10, 'tracts':1000, 'blocks':3},
+    'statewide':{'geography':'tract', 'states':1, 'countys':60, 'subdivisions':3, 'tracts':25, 'blocks':3},
+    'nationwide':{'geography':'block', 'states':50, 'countys':60, 'subdivisions':3, 'tracts':25, 'blocks':3}}
+INCOMES = [0, 10000, 15000, 20000, 25000, 30000, 35000, 40000, 45000, 50000, 60000, 75000, 100000, 125000, 150000, 200000]
+DIMENSIONS = ['states', 'countys', 'subdivisions', 'tracts', 'blocks', 'variables', 'flows']
+
+
+_universe = lambda size, **kwargs: {**{key:value for key, value in SIZES[size].items() if key in DIMENSIONS}, **{key:value for key, value in kwargs.items() if key in DIMENSIONS}}
+_percentiles = lambda x: {'p{}'.format(percent):round(float(value) * 1000, 3) for percent, value in zip((50, 90, 99), np.percentile(x, [50, 90, 99]))} if len(x) else {}
+_bool = lambda x: str(x).lower() in ('true', 'yes', '1')
+_commit = lambda: subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIR, capture_output=True, text=True).stdout.strip() or None
+
+
+class USCensus_StubUniverse(object):
+    def __init__(self, *args, states=1, countys=10, subdivisions=3, tracts=20, blocks=3, variables=16, flows=10, **kwargs):
+        self.__counts = {'state':int(states), 'county':int(countys), 'county subdivision':int(subdivisions), 'tract':int(tracts), 'block group':int(blocks)}
+        self.__variables = int(variables)
+        self.__flows = int(flows)
+
+    def __repr__(self): return "{}({})".format(self.__class__.__name__, ', '.join(['{}={}'.format(key.replace(' ', '_'), value) for key, value in self.__counts.items()]))
+
+    @staticmethod
+    def code(level, index):
+        codes = {'state':'{:02d}', 'county':'{:03d}', 'county subdivision':'{:05d}', 'tract':'{:06d}', 'block group':'{:d}'}
+        return codes[level].format(index * 2 - 1 if level == 'county' else index * 100 if level in ('county subdivision', 'tract') else index)
+
+    @staticmethod
+    def name(level, code):
+        names = {'state':'State {}', 'county':'Kirby {} County', 'county subdivision':'District {} CCD', 'tract':'Census Tract {}', 'block group':'Block Group {}'}
+        return names[level].format(int(code) if level == 'tract' else code)
+
+    def codes(self, level, value='*'):
+        codes = [self.code(level, index) for index in range(1, self.__counts[level] + 1)]
+        return codes if value == '*' else [code for code in codes if code == value]
+
+    def geographys(self, level, filters={}):
+        path = [*HIERARCHY[level], level]
+        for codes in itertools.product(*[self.codes(key, filters.get(key, '*')) for key in path]):
+            yield ', '.join([self.name(key, code) for key, code in zip(path, codes)][::-1]), list(codes)
+
+    def geography(self):
+        return {'fips':[{'name':level, **({'requires':requires} if requires else {})} for level, requires in HIERARCHY.items()]}
+
+    def groups(self, group):
+        edges = [10000 + 5000 * index for index in range(self.__variables - 1)]
+        labels = ['less than ${:,}'.format(edges[0]), *['${:,} to ${:,}'.format(lower, upper - 1) for lower, upper in zip(edges[:-1], edges[1:])], '${:,} or more'.format(edges[-1])]
+        labels = ['estimate!!total:', *['estimate!!total:!!{}'.format(label) for label in labels]]
+        variables = {'{}_{:03d}E'.format(group, index):{'label':label} for index, label in enumerate(labels, start=1)}
+        return {'variables':variables, 'groups':variables}
+
+    def vardata(self, level, filters, tags):
+        path = [*HIERARCHY[level], level]
+        rows = [[*tags, *path]]
+        for index, (name, codes) in enumerate(self.geographys(level, filters)):
+            values = [name if tag == 'NAME' else str((index * 7919 + column * 104729) % 5000) for column, tag in enumerate(tags)]
+            rows.append([*values, *codes])
+        return rows
+
+    def flows(self, level, filters, tags):
+        path = [*HIERARCHY[level], level]
+        rows = [[*tags, *path]]
+        for index, (name, codes) in enumerate(self.geographys(level, filters)):
+            for target in range(1, self.__flows + 1):
+                entering, exiting = (index * 7919 + target * 104729) % 500, (index * 104729 + target * 7919) % 500
+                county = self.code('county', target)
+                values = {'MOVEDNET':str(entering - exiting), 'MOVEDIN':str(entering), 'MOVEDOUT':str(exiting), 'FULL1_NAME':name, 'FULL2_NAME':', '.join([self.name('county', county), self.name('state', codes[0])]), 'STATE2':codes[0], 'COUNTY2':county}
+                rows.append([*[values.get(tag, None) for tag in tags], *codes])
+        return rows
+
+
+class USCensus_StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args, **kwargs): pass
+
+    def do_GET(self):
+        if not self.server.admit(): return self.reply(429, [["error"], ["Too Many Requests"]])
+        split = urlsplit(self.path)
+        segments = [segment for segment in unquote(split.path).split('/') if segment]
+        parms = {key:unquote(value) for key, value in parse_qsl(split.query)}
+        try: contents = self.server.route(segments, parms)
+        except (KeyError, ValueError, IndexError) as error: return self.reply(404, [["error"], [str(error)]])
+        return self.reply(200, contents)
+
+    def reply(self, code, contents):
+        body = json.dumps(contents).encode('utf-8')
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        if code == 200 and self.headers.get('If-None-Match') == etag:
+            self.server.record(None, b'', notmodified=True)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.server.record(contents if code == 200 else None, body)
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        if code == 200: self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class USCensus_StubServer(ThreadingHTTPServer):
+    def __init__(self, *args, universe=None, host='127.0.0.1', port=0, limit=None, window=60, **kwargs):
+        super().__init__((host, port), USCensus_StubHandler)
+        self.__universe = universe
+        self.__limit = limit
+        self.__window = window
+        self.__history = deque()
+        self.__counters = {'requests':0, 'notmodified':0, 'rows':0, 'bytes':0}
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+    @property
+    def url(self): return 'http://{}'.format(self.domain)
+    @property
+    def domain(self): return '{}:{}'.format(*self.server_address)
+    @property
+    def counters(self): return dict(self.__counters)
+
+    def __enter__(self):
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+    def admit(self):
+        if self.__limit is None: return True
+        with self.__lock:
+            timestamp = time.monotonic()
+            while self.__history and timestamp - self.__history[0] > self.__window: self.__history.popleft()
+            if len(self.__history) >= self.__limit: return False
+            self.__history.append(timestamp)
+            return True
+
+    def record(self, contents, body, notmodified=False):
+        with self.__lock:
+            self.__counters['requests'] += 1
+            self.__counters['notmodified'] += int(notmodified)
+            self.__counters['bytes'] += len(body)
+            self.__counters['rows'] += max(len(contents) - 1, 0) if isinstance(contents, list) else 0
+
+    def route(self, segments, parms):
+        if self.__universe is None or not segments: return [["NAME", "state"], ["Alabama", "01"]]
+        segments = [segment[:-len('.json')] if segment.endswith('.json') else segment for segment in segments]
+        segments = [segment for segment in segments if segment]
+        if segments[-1] == 'geography': return self.__universe.geography()
+        for key in ('group', 'groups'):
+            if key in segments: return self.__universe.groups(segments[segments.index(key) + 1])
+        level, value = GEOFILTERS.match(parms['for'].replace('%20', ' ')).groups()
+        filters = {key.strip():item for key, item in GEOFILTERS.findall(parms.get('in', '').replace('%20', ' '))}
+        filters[level] = value
+        tags = [tag for tag in parms['get'].split(',') if tag]
+        if segments[-1] == 'flows': return self.__universe.flows(level, filters, tags)
+        return self.__universe.vardata(level, filters, tags)
+
+
+@contextmanager
+def redirected(module, server, *names):
+    originals = {name:getattr(module, name) for name in names}
+    apikeys = getattr(module, 'load_apikeys')
+    try:
+        for name, original in originals.items(): setattr(module, name, types.new_class(original.__name__, (original,), {'protocol':'http', 'domain':server.domain}))
+        setattr(module, 'load_apikeys', lambda: {'uscensus':'benchmark'})
+        yield module
+    finally:
+        for name, original in originals.items(): setattr(module, name, original)
+        setattr(module, 'load_apikeys', apikeys)
+
+
+def benchmark_delayer(delayer, url, *args, count=20, **kwargs):
+    session, responses, failures = requests.Session(), 0, 0
+    start = time.monotonic()
+    while responses < count:
+        delayer()
+        response = session.get(url)
+        try: response.raise_for_status()
+        except Exception as error:
+            failures += 1
+            delayer.failure(error)
+            continue
+        responses += 1
+        delayer.success()
+    elapsed = time.monotonic() - start
+    return {'benchmark':'delayer', 'delayer':repr(delayer), 'requests':responses, 'failures':failures, 'seconds':round(elapsed, 3), 'throughput':round(responses * 60 / elapsed, 3)}
+
+
+def benchmark_downloader(webdownloader, server, *args, **kwargs):
+    latencies = []
+    start = timestamp = time.perf_counter()
+    for webcache in webdownloader.execute(*args, **kwargs):
+        latencies.append(time.perf_counter() - timestamp)
+        timestamp = time.perf_counter()
+    elapsed = time.perf_counter() - start
+    counters = server.counters
+    return {'querys':len(latencies), 'requests':counters['requests'], 'rows':counters['rows'], 'bytes':counters['bytes'], 'seconds':round(elapsed, 3),
+            'throughput':round(counters['rows'] / elapsed, 1), 'querythroughput':round(len(latencies) / elapsed, 3), 'latency':_percentiles(latencies)}
+
+
+def delayer(*args, count=20, wait=15, rate=60, limit=10, window=60, **kwargs):
+    with USCensus_StubServer(limit=limit, window=window) as server:
+        return [benchmark_delayer(webdelayer, server.url, count=count) for webdelayer in (USCensus_WebDelayer('constant', wait=wait), USCensus_WebThrottle(rate=rate, burst=5))]
+
+
+def acs(*args, size='county', table='#hh|geo|inc', date='2019', rate=None, batched=False, typed=False, concurrency=None, processes=None, **kwargs):
+    from uscensus import acs as application
+    universe = USCensus_StubUniverse(**_universe(size, **kwargs))
+    geography = SIZES[size]['geography']
+    states = [universe.name('state', code) for code in universe.codes('state')]
+    countys = [universe.name('county', code) for code in universe.codes('county')] if geography != 'county' else [None]
+    querys = [{'table':table, 'date':date, 'geography':geography, 'state':state, **({'county':county} if county else {})} for state in states for county in countys]
+    with USCensus_StubServer(universe=universe) as server, redirected(application, server, 'USCensus_ACSQuery_WebURL', 'USCensus_ACSData_WebURL'), tempfile.TemporaryDirectory() as directory:
+        webdelayer = USCensus_WebThrottle(rate=rate, burst=5) if rate else USCensus_WebDelayer('constant', wait=0)
+        webmetadata = USCensus_MetadataCache(os.path.join(directory, 'metadata'), size=256)
+        downloader = application.USCensus_ACS_WebAsyncDownloader if concurrency else application.USCensus_ACS_WebDownloader
+        parameters = dict(queue=querys, delayer=webdelayer, metadata=webmetadata, batched=batched, typed=typed, **({'concurrency':concurrency} if concurrency else {}), **({'processes':processes} if processes else {}))
+        webdownloader = downloader(os.path.join(directory, 'repository'), os.path.join(directory, 'report.csv'), **parameters)
+        results = benchmark_downloader(webdownloader, server, **parameters)
+    return [{'benchmark':'acs', 'size':size, 'geography':geography, 'batched':batched, 'typed':typed, 'concurrency':concurrency, 'processes':processes, 'universe':repr(universe), **results}]
+
+
+def refresh(*args, size='county', table='#hh|geo|inc', date='2019', **kwargs):
+    from uscensus import acs as application
+    from uscensus.refresh import USCensus_WebManifest, USCensus_WebRefresh
+    universe = USCensus_StubUniverse(**_universe(size, **kwargs))
+    geography = SIZES[size]['geography']
+    states = [universe.name('state', code) for code in universe.codes('state')]
+    countys = [universe.name('county', code) for code in universe.codes('county')] if geography != 'county' else [None]
+    querys = [{'table':table, 'date':date, 'geography':geography, 'state':state, **({'county':county} if county else {})} for state in states for county in countys]
+    records = []
+    with USCensus_StubServer(universe=universe) as server, redirected(application, server, 'USCensus_ACSQuery_WebURL', 'USCensus_ACSData_WebURL'), tempfile.TemporaryDirectory() as directory:
+        webdelayer = USCensus_WebDelayer('constant', wait=0)
+        webmetadata = USCensus_MetadataCache(os.path.join(directory, 'metadata'), size=256)
+        for attempt in ('initial', 'unchanged'):
+            previous = server.counters
+            webrefresh = USCensus_WebRefresh(USCensus_WebManifest(os.path.join(directory, 'refresh', 'acs.json')), delayer=webdelayer)
+            parameters = dict(queue=querys, delayer=webdelayer, metadata=webmetadata, refresh=webrefresh)
+            webdownloader = application.USCensus_ACS_WebDownloader(os.path.join(directory, 'repository'), os.path.join(directory, 'report.csv'), **parameters)
+            start = time.perf_counter()
+            webcaches = sum([1 for webcache in webdownloader.execute(**parameters)])
+            elapsed = time.perf_counter() - start
+            counters = {key:value - previous[key] for key, value in server.counters.items()}
+            records.append({'benchmark':'refresh', 'size':size, 'attempt':attempt, 'universe':repr(universe), 'webcaches':webcaches, 'changed':len(webrefresh.changed), 'unchanged':len(webrefresh.unchanged), **counters, 'seconds':round(elapsed, 3)})
+    return records
+
+
+def migrate(*args, size='county', date='2019', rate=None, typed=False, concurrency=None, processes=None, **kwargs):
+    from uscensus import migrate as application
+    universe = USCensus_StubUniverse(**_universe(size, **kwargs))
+    querys = [{'date':date, 'state':universe.name('state', state), 'county':universe.name('county', county)} for state in universe.codes('state') for county in universe.codes('county')]
+    with USCensus_StubServer(universe=universe) as server, redirected(application, server, 'USCensus_ACS_WebURL'), tempfile.TemporaryDirectory() as directory:
+        webdelayer = USCensus_WebThrottle(rate=rate, burst=5) if rate else USCensus_WebDelayer('constant', wait=0)
+        webmetadata = USCensus_MetadataCache(os.path.join(directory, 'metadata'), size=256)
+        downloader = application.USCensus_ACS_WebAsyncDownloader if concurrency else application.USCensus_ACS_WebDownloader
+        parameters = dict(queue=querys, delayer=webdelayer, metadata=webmetadata, typed=typed, **({'concurrency':concurrency} if concurrency else {}), **({'processes':processes} if processes else {}))
+        webdownloader = downloader(os.path.join(directory, 'repository'), os.path.join(directory, 'report.csv'), **parameters)
+        results = benchmark_downloader(webdownloader, server, **parameters)
+    return [{'benchmark':'migrate', 'size':size, 'typed':typed, 'concurrency':concurrency, 'processes':processes, 'universe':repr(universe), **results}]
+
+
+def stages(*args, size='county', table='#hh|geo|inc', repeat=5, **kwargs):
+    from uscensus import acs as application
+    universe = USCensus_StubUniverse(**_universe(size, **kwargs))
+    level = LEVELS[SIZES[size]['geography']]
+    tablequery = application.TABLES.loc[table, :].squeeze().to_dict()
+    variables = {key:value['label'] for key, value in universe.groups(tablequery['group'])['variables'].items() if application.LABELS[tablequery['label']].findall(value['label'])}
+    contents = universe.vardata(level, {}, ['NAME', *variables.keys()])
+    text = json.dumps(contents)
+    geokeys = [*HIERARCHY[level], level]
+    parse = lambda: application.vardata_parser(contents)
+    stages = {
+        'decode':(lambda: text, lambda x: json.loads(x)),
+        'parse':(lambda: contents, application.vardata_parser),
+        'typed':(parse, lambda x: typed_parser(x, numerics=list(variables.keys()), categoricals=geokeys)),
+        'geography':(parse, application.USCensus_ACS_WebPage.geography),
+        'variables':(lambda: application.USCensus_ACS_WebPage.geography(parse()), lambda x: application.USCensus_ACS_WebPage.variables(x, variables=variables, **tablequery))}
+    records = []
+    for stage, (prepare, function) in stages.items():
+        latencies = []
+        for index in range(repeat):
+            inputs = prepare()
+            start = time.perf_counter()
+            function(inputs)
+            latencies.append(time.perf_counter() - start)
+        records.append({'benchmark':'stages', 'stage':stage, 'size':size, 'geography':level, 'rows':len(contents) - 1, 'variables':len(variables),
+                        'seconds':round(float(np.median(latencies)), 4), 'throughput':round((len(contents) - 1) / float(np.median(latencies)), 1), 'latency':_percentiles(latencies)})
+    return records
+
+
+def synthetic_vardata(*args, rows=1000, variables=10, group='B19001', seed=0, **kwargs):
+    generator = np.random.default_rng(seed)
+    tags = ['{}_{:03d}E'.format(group, index) for index in range(1, variables + 1)]
+    countys = np.arange(rows) % 100 + 1
+    tracts = np.arange(rows) // 100 + 1
+    header = ['NAME', *tags, 'state', 'county', 'tract']
+    names = ['Census Tract {}, County {} County, Texas'.format(tract, county) for tract, county in zip(tracts, countys)]
+    estimates = generator.integers(0, 5000, size=(rows, variables)).astype(str)
+    body = [[name, *estimate, '48', '{:03d}'.format(county), '{:06d}'.format(tract)] for name, estimate, county, tract in zip(names, estimates.tolist(), countys, tracts)]
+    return [header, *body]
+
+
+def timer(function, *args, repeat=3, **kwargs):
+    timings = []
+    for index in range(repeat):
+        start = time.perf_counter()
+        results = function(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return results, min(timings)
+
+
+def geography(*args, rows=10000, variables=16, **kwargs):
+    contents = synthetic_vardata(rows=rows, variables=variables)
+    dataframe = pd.DataFrame(data=contents[1:], columns=contents[0])
+    geokeys = ['state', 'county', 'tract']
+    melted = dataframe.melt(id_vars=['NAME', *geokeys], value_vars=contents[0][1:variables + 1], var_name='header', value_name='households')
+    function = lambda x: str(Geography(keys=list(geokeys), names=x.to_dict()['NAME'].split(', ')[::-1], values=[x.to_dict()[geokey] for geokey in geokeys]))
+    legacy, legacytime = timer(lambda: melted.apply(function, result_type='reduce', axis=1), repeat=1)
+    vectorized, vectorizedtime = timer(lambda: geography_series(dataframe, keys=geokeys, names='NAME', values=geokeys))
+    melted = dataframe.assign(geography=vectorized).melt(id_vars=['NAME', *geokeys, 'geography'], value_vars=contents[0][1:variables + 1], var_name='header', value_name='households')
+    assert (melted['geography'].to_numpy() == legacy.to_numpy()).all()
+    return [{'benchmark':'geography', 'rows':len(legacy), 'legacy':round(legacytime, 4), 'vectorized':round(vectorizedtime, 4), 'speedup':round(legacytime / vectorizedtime, 1)}]
+
+
+def typed(*args, rows=10000, variables=16, **kwargs):
+    contents = synthetic_vardata(rows=rows, variables=variables)
+    tags, geokeys = contents[0][1:variables + 1], ['state', 'county', 'tract']
+    legacyparser = lambda x: pd.DataFrame(data=list(x)[1:], columns=list(x)[0])
+    typedparser = lambda x: typed_parser((lambda rows: pd.DataFrame.from_records(rows, columns=next(rows)))(iter(x)), numerics=tags, categoricals=geokeys)
+    records = []
+    for name, parser in (('legacy', legacyparser), ('typed', typedparser)):
+        dataframe, parsetime = timer(parser, contents)
+        tracemalloc.start()
+        parser(contents)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        melted = dataframe.melt(id_vars=['NAME', *geokeys], value_vars=tags, var_name='header', value_name='households')
+        if name == 'typed': melted['header'] = melted['header'].astype('category')
+        aggregate = lambda: melted.assign(households=pd.to_numeric(melted['households'])).groupby(['county', 'header'], observed=True)['households'].sum()
+        results, aggregatetime = timer(aggregate)
+        memory = melted.memory_usage(deep=True).sum()
+        records.append({'benchmark':'typed', 'parser':name, 'rows':len(melted), 'parse':round(parsetime, 4), 'peak':int(peak), 'memory':int(memory), 'aggregate':round(aggregatetime, 4)})
+    return records
+
+
+def synthetic_brackets(*args, rows=10000, seed=0, **kwargs):
+    generator = np.random.default_rng(seed)
+    labels = ['<${:,}'.format(INCOMES[1])] + ['${:,}|${:,}'.format(lower, upper - 1) for lower, upper in zip(INCOMES[1:-1], INCOMES[2:])] + ['>${:,}'.format(INCOMES[-1])]
+    counts = generator.integers(0, 500, size=(rows, len(labels)))
+    return pd.DataFrame({'geography':np.repeat(np.arange(rows), len(labels)), 'income':pd.Categorical(np.tile(labels, rows), categories=labels), 'households':counts.ravel()})
+
+
+def legacy_median(dataframe):
+    bounds = [bracket_parser(label) for label in dataframe['income']]
+    counts = list(dataframe['households'])
+    edges = [lower for lower, upper in bounds[1:]] + [bounds[-1][1]]
+    target, cumulative = sum(counts) / 2, 0
+    for (lower, upper), edge, count in zip(bounds, edges, counts):
+        if count > 0 and cumulative + count >= target: return lower if np.isinf(edge) else lower + (target - cumulative) / count * (edge - lower)
+        cumulative += count
+    return np.nan
+
+
+def brackets(*args, rows=10000, **kwargs):
+    dataframe = synthetic_brackets(rows=rows)
+    legacy, legacytime = timer(lambda: dataframe.groupby('geography', observed=True)[['income', 'households']].apply(legacy_median), repeat=1)
+    distribution, buildtime = timer(lambda: USCensus_BracketDistribution.fromframe(dataframe, header='income', universe='households'))
+    vectorized, vectorizedtime = timer(distribution.median)
+    rebinned, rebintime = timer(lambda: distribution.rebin([0, 25000, 50000, 100000, np.inf]))
+    assert np.allclose(legacy.to_numpy(), vectorized.to_numpy())
+    return [{'benchmark':'brackets', 'geographys':rows, 'rows':len(dataframe), 'legacy':round(legacytime, 4), 'build':round(buildtime, 4), 'median':round(vectorizedtime, 4),
+             'rebin':round(rebintime, 4), 'speedup':round(legacytime / (buildtime + vectorizedtime), 1)}]
+
+
+def imports(*args, repeat=5, heavy=['pandas', 'numpy', 'regex', 'parse', 'pyarrow', 'requests', 'asyncio'], **kwargs):
+    script = "import sys, time; start = time.perf_counter(); import uscensus.{module}; print(time.perf_counter() - start); print(','.join([name for name in sys.argv[1:] if name in sys.modules]))"
+    records = []
+    for module in ('acs', 'migrate'):
+        timings, loaded = [], []
+        for index in range(repeat):
+            process = subprocess.run([sys.executable, '-c', script.format(module=module), *heavy], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+            seconds, loaded = process.stdout.strip().split('\n')
+            timings.append(float(seconds))
+        records.append({'benchmark':'imports', 'module':module, 'seconds':round(float(np.median(timings)), 4), 'latency':_percentiles(timings), 'loaded':[name for name in loaded.split(',') if name]})
+    return records
+
+
+def instrument(*args, count=100000, **kwargs):
+    records = []
+    for name, webinstrument in (('disabled', USCensus_WebInstrument()), ('enabled', USCensus_WebInstrument())):
+        if name == 'enabled': webinstrument.configure()
+        start = time.perf_counter()
+        for index in range(count):
+            with webinstrument('stage', rows=1): pass
+        elapsed = time.perf_counter() - start
+        records.append({'benchmark':'instrument', 'instrument':name, 'stages':count, 'seconds':round(elapsed, 4), 'overhead':round(elapsed / count * 1e9, 1)})
+    return records
+
+
+BENCHMARKS = {'delayer':delayer, 'acs':acs, 'refresh':refresh, 'migrate':migrate, 'stages':stages, 'geography':geography, 'typed':typed, 'brackets':brackets, 'instrument':instrument, 'imports':imports}
+
+
+def execute(benchmark, parameters, connection):
+    try: records = BENCHMARKS[benchmark](**parameters)
+    except BaseException as error:
+        connection.send(error)
+        return
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    connection.send([{**record, 'rss':round(rss, 1)} for record in records])
+
+
+def main(*args, file=None, **kwargs):
+    context = multiprocessing.get_context('spawn')
+    commit, timestamp = _commit(), time.strftime('%Y-%m-%dT%H:%M:%S')
+    for benchmark in args or BENCHMARKS.keys():
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=execute, args=(benchmark, kwargs, sender), name=benchmark)
+        process.start()
+        results = receiver.recv()
+        process.join()
+        if isinstance(results, BaseException): raise results
+        records = [json.dumps({'commit':commit, 'timestamp':timestamp, **record}) for record in results]
+        for record in records: print(record)
+        if file is None: continue
+        with open(file, 'a') as output: output.write(''.join(['{}\n'.format(record) for record in records]))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level='INFO', format="[%(levelname)s, %(threadName)s]:  %(message)s")
+    parsers = {'count':int, 'rows':int, 'variables':int, 'wait':float, 'rate':float, 'limit':int, 'window':float, 'repeat':int, 'concurrency':int, 'processes':int, 'batched':_bool, 'typed':_bool}
+    inputparser = InputParser(proxys={'assign':'=', 'space':'_'}, parsers={**parsers, **{dimension:int for dimension in DIMENSIONS}}, default=str)
+    inputparser(*sys.argv[1:])
+    main(*inputparser.inputArgs, **inputparser.inputParms)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Bracketed Distributions
+@author: Jack Kirby Cook
+
+"""
+
+import re
+import logging
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_BracketDistribution', 'bracket_parser', 'brackets_parser', 'bounds_parser']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+np = lazy_module('numpy')
+pd = lazy_module('pandas')
+NUMBER = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+
+_number = lambda string: float(NUMBER.search(string).group(0).replace(',', '')) if NUMBER.search(string) else float('nan')
+_quantile = lambda quantile: 'p{:g}'.format(float(quantile) * 100)
+_bound = lambda value: '{:g}'.format(value)
+
+
+def _label(lower, upper):
+    if np.isinf(upper): return '>{}'.format(_bound(lower))
+    if lower == upper: return _bound(lower)
+    return '{}|{}'.format(_bound(lower), _bound(upper))
+
+
+def bracket_parser(label):
+    label = str(label)
+    values = [_number(value) for value in label.lstrip('<>').split('|')]
+    if any([np.isnan(value) for value in values]): return float('nan'), float('nan')
+    if label.startswith('<'): return 0.0, values[0]
+    if label.startswith('>'): return values[0], float('inf')
+    return values[0], values[-1]
+
+
+def brackets_parser(labels):
+    bounds = np.array([bracket_parser(label) for label in labels], dtype=np.float64).reshape(-1, 2)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def bounds_parser(series):
+    series = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    lower, upper = brackets_parser(series.cat.categories)
+    codes = series.cat.codes.to_numpy()
+    return np.append(lower, np.nan)[codes], np.append(upper, np.nan)[codes]
+
+
+class USCensus_BracketDistribution(object):
+    def __init__(self, counts, lower, upper, *args, index=None, labels=None, **kwargs):
+        counts, lower, upper = np.asarray(counts, dtype=np.float64), np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+        valid = ~np.isnan(lower) & ~np.isnan(upper)
+        order = np.lexsort((upper[valid], lower[valid]))
+        self.__counts = np.nan_to_num(counts.reshape(-1, len(lower))[:, valid][:, order])
+        self.__lower, self.__upper = lower[valid][order], upper[valid][order]
+        self.__index = pd.Index(index) if index is not None else pd.RangeIndex(len(self.__counts))
+        self.__labels = np.asarray(labels, dtype=object)[valid][order] if labels is not None else np.array([_label(*bounds) for bounds in zip(self.__lower, self.__upper)], dtype=object)
+        following = np.append(self.__lower, np.inf)[np.searchsorted(self.__lower, self.__lower, side='right')]
+        closed = np.isfinite(self.__upper) & (self.__upper > self.__lower) & np.isfinite(following) & (following >= self.__upper)
+        self.__edges = np.where(closed, following, self.__upper)
+
+    def __repr__(self): return "{}(geographys={}, brackets={})".format(self.__class__.__name__, *self.shape)
+    def __len__(self): return len(self.__counts)
+
+    @property
+    def shape(self): return self.__counts.shape
+    @property
+    def counts(self): return self.__counts
+    @property
+    def lower(self): return self.__lower
+    @property
+    def upper(self): return self.__edges
+    @property
+    def index(self): return self.__index
+    @property
+    def labels(self): return self.__labels
+    @property
+    def totals(self): return pd.Series(self.__counts.sum(axis=1), index=self.__index, name='total')
+
+    @classmethod
+    def fromframe(cls, dataframe, *args, header, universe, index='geography', **kwargs):
+        geographys, uniques = pd.factorize(dataframe[index], sort=False)
+        brackets = dataframe[header] if isinstance(dataframe[header].dtype, pd.CategoricalDtype) else dataframe[header].astype('category')
+        codes, labels = brackets.cat.codes.to_numpy(), np.asarray(brackets.cat.categories, dtype=object)
+        valid = (geographys >= 0) & (codes >= 0)
+        values = pd.to_numeric(dataframe[universe], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        positions = geographys[valid].astype(np.int64) * len(labels) + codes[valid]
+        counts = np.bincount(positions, weights=np.nan_to_num(values[valid]), minlength=len(uniques) * len(labels)).reshape(len(uniques), len(labels))
+        if '{}_lower'.format(header) in dataframe.columns and '{}_upper'.format(header) in dataframe.columns:
+            lower, upper = np.full(len(labels), np.nan), np.full(len(labels), np.nan)
+            lower[codes[valid]] = dataframe['{}_lower'.format(header)].to_numpy(dtype=np.float64)[valid]
+            upper[codes[valid]] = dataframe['{}_upper'.format(header)].to_numpy(dtype=np.float64)[valid]
+        else: lower, upper = brackets_parser(labels)
+        return cls(counts, lower, upper, index=uniques, labels=labels)
+
+    def toframe(self, *args, header='bracket', universe='count', index='geography', **kwargs):
+        geographys, brackets = self.shape
+        return pd.DataFrame({index:np.repeat(np.asarray(self.__index), brackets), header:pd.Categorical(np.tile(self.__labels, geographys), categories=list(dict.fromkeys(self.__labels))),
+                             '{}_lower'.format(header):np.tile(self.__lower, geographys), '{}_upper'.format(header):np.tile(self.__edges, geographys), universe:self.__counts.ravel()})
+
+    def percentiles(self, quantiles):
+        """Linearly interpolated within the bracket holding each quantile, the lower bound in the open top bracket."""
+        quantiles = np.atleast_1d(np.asarray(quantiles, dtype=np.float64))
+        cumulative = np.cumsum(self.__counts, axis=1)
+        totals = cumulative[:, -1:] if cumulative.shape[1] else np.zeros((len(self), 1))
+        targets = totals * quantiles[np.newaxis, :]
+        positions = np.minimum((cumulative[:, np.newaxis, :] < targets[:, :, np.newaxis]).sum(axis=2), max(self.shape[1] - 1, 0))
+        rows = np.arange(len(self))[:, np.newaxis]
+        previous = np.where(positions > 0, cumulative[rows, np.maximum(positions - 1, 0)], 0)
+        counts, lower, widths = self.__counts[rows, positions], self.__lower[positions], self.__edges[positions] - self.__lower[positions]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fractions = np.clip(np.where(counts > 0, (targets - previous) / counts, 0), 0, 1)
+            values = np.where(np.isfinite(widths), lower + fractions * widths, lower)
+        values = np.where(totals > 0, values, np.nan)
+        return pd.DataFrame(values, index=self.__index, columns=[_quantile(quantile) for quantile in quantiles])
+
+    def median(self): return self.percentiles([0.5])['p50'].rename('median')
+
+    def mean(self, *args, top=1.5, **kwargs):
+        midpoints = np.where(np.isfinite(self.__edges), (self.__lower + self.__edges) / 2, self.__lower * top)
+        totals = self.__counts.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'): values = np.where(totals > 0, self.__counts @ midpoints / totals, np.nan)
+        return pd.Series(values, index=self.__index, name='mean')
+
+    def rebin(self, edges):
+        """Counts split by overlap assuming a uniform density, point and open brackets moved whole by their lower bound."""
+        edges = np.asarray(edges, dtype=np.float64)
+        lower, upper = edges[np.newaxis, :-1], edges[np.newaxis, 1:]
+        widths = (self.__edges - self.__lower)[:, np.newaxis]
+        bounded = np.isfinite(widths) & (widths > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overlaps = np.clip(np.minimum(self.__edges[:, np.newaxis], upper) - np.maximum(self.__lower[:, np.newaxis], lower), 0, None) / widths
+        contained = (self.__lower[:, np.newaxis] >= lower) & (self.__lower[:, np.newaxis] < upper)
+        weights = np.where(bounded, np.nan_to_num(overlaps), contained.astype(np.float64))
+        return self.__class__(self.__counts @ weights, edges[:-1], edges[1:], index=self.__index)
+
+    def aggregate(self, groups):
+        codes, uniques = pd.factorize(np.asarray(groups), sort=False)
+        counts = np.stack([np.bincount(codes[codes >= 0], weights=self.__counts[codes >= 0, bracket], minlength=len(uniques)) for bracket in range(self.shape[1])], axis=1) if self.shape[1] else np.zeros((len(uniques), 0))
+        return self.__class__(counts, self.__lower, self.__edges, index=uniques, labels=self.__labels)
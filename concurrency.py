@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Concurrent Download Engine
+@author: Jack Kirby Cook
+
+"""
+
+import queue
+import threading
+import logging
+from contextlib import ExitStack
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebEngine']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+asyncio = lazy_module('asyncio')
+futures = lazy_module('concurrent.futures')
+
+
+_listed = lambda function, *args: list(function(*args))
+
+
+class USCensus_WebFinished(object): pass
+class USCensus_WebFailure(object):
+    def __init__(self, error): self.error = error
+
+
+class USCensus_WebEngine(object):
+    def __init__(self, reader, page, *args, delayer, concurrency=4, depth=16, **kwargs):
+        self.__reader = reader
+        self.__page = page
+        self.__delayer = delayer
+        self.__concurrency = int(concurrency)
+        self.__depth = int(depth)
+
+    def __repr__(self): return "{}(concurrency={}, depth={})".format(self.__class__.__name__, self.__concurrency, self.__depth)
+
+    def __call__(self, fetch, reshape, querys, *args, **kwargs):
+        results = queue.Queue(maxsize=self.__depth)
+        thread = threading.Thread(target=self.run, args=(fetch, reshape, list(querys), results), daemon=True)
+        thread.start()
+        while True:
+            result = results.get()
+            if isinstance(result, USCensus_WebFinished): break
+            if isinstance(result, USCensus_WebFailure): raise result.error
+            yield result
+        thread.join()
+
+    def run(self, fetch, reshape, querys, results):
+        try: asyncio.run(self.execute(fetch, reshape, querys, results))
+        except BaseException as error: results.put(USCensus_WebFailure(error))
+        else: results.put(USCensus_WebFinished())
+
+    async def execute(self, fetch, reshape, querys, results):
+        loop = asyncio.get_running_loop()
+        with ExitStack() as stack:
+            fetchers = stack.enter_context(futures.ThreadPoolExecutor(max_workers=self.__concurrency, thread_name_prefix='WebFetcher'))
+            parsers = stack.enter_context(futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='WebParser'))
+            writers = stack.enter_context(futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='WebWriter'))
+            webpages = asyncio.Queue()
+            payloads = asyncio.Semaphore(self.__concurrency + self.__depth)
+            for index in range(self.__concurrency):
+                session = stack.enter_context(self.__reader())
+                webpages.put_nowait(self.__page(session, delayer=self.__delayer))
+
+            async def task(query):
+                async with payloads:
+                    webpage = await webpages.get()
+                    try: payload = await loop.run_in_executor(fetchers, fetch, webpage, query)
+                    finally: webpages.put_nowait(webpage)
+                    values = await loop.run_in_executor(parsers, _listed, reshape, payload)
+                    del payload
+                for value in values: await loop.run_in_executor(writers, results.put, value)
+
+            await asyncio.gather(*[task(query) for query in querys])
+
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Typed DataFrames
+@author: Jack Kirby Cook
+
+"""
+
+import logging
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['numeric_parser', 'typed_parser', 'SENTINELS']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+np = lazy_module('numpy')
+pd = lazy_module('pandas')
+SENTINELS = (-999999999, -888888888, -666666666, -555555555, -333333333, -222222222)
+
+
+def numeric_parser(series):
+    values = pd.to_numeric(series, errors='coerce')
+    values = values.mask(values.isin(SENTINELS))
+    integral = values.dropna()
+    if bool((integral == np.floor(integral)).all()): return values.astype('Int64')
+    return values.astype('Float64')
+
+
+def typed_parser(dataframe, *args, numerics=[], categoricals=[], **kwargs):
+    for column in [column for column in numerics if column in dataframe.columns]: dataframe[column] = numeric_parser(dataframe[column])
+    for column in [column for column in categoricals if column in dataframe.columns]: dataframe[column] = dataframe[column].astype('category')
+    return dataframe
+
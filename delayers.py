@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Adaptive Delayers
+@author: Jack Kirby Cook
+
+"""
+
+import time
+import threading
+import logging
+
+from webscraping.webtimers import WebDelayer
+from uscensus.instrument import INSTRUMENT
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebDelayer', 'USCensus_WebThrottle', 'retrying_session', 'HTTPCODES', 'RETRYCODES', 'THROTTLECODES']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+HTTPCODES = (429, 500, 502, 503, 504)
+THROTTLECODES = (429, 503)
+RETRYCODES = tuple([code for code in HTTPCODES if code not in THROTTLECODES])
+requests = lazy_module('requests')
+adapters = lazy_module('requests.adapters')
+retry = lazy_module('urllib3.util.retry')
+
+
+_httpcode = lambda error: getattr(getattr(error, 'response', None), 'status_code', None)
+
+
+def retrying_session(*args, retries=3, backoff=0.3, httpcodes=RETRYCODES, **kwargs):
+    retrys = retry.Retry(total=retries, backoff_factor=backoff, status_forcelist=httpcodes, allowed_methods=['GET'])
+    session = requests.Session()
+    session.mount('https://', adapters.HTTPAdapter(max_retries=retrys))
+    session.mount('http://', adapters.HTTPAdapter(max_retries=retrys))
+    return session
+
+
+class USCensus_WebDelayer(WebDelayer):
+    def __call__(self, *args, **kwargs):
+        with INSTRUMENT('delay'): super().__call__(*args, **kwargs)
+
+    def success(self, *args, **kwargs): pass
+    def failure(self, *args, **kwargs): pass
+
+    def attempt(self, function, *args, retries=3, **kwargs):
+        for attempt in range(retries + 1):
+            try: results = function(*args, **kwargs)
+            except Exception as error:
+                self.failure(error)
+                if attempt < retries and _httpcode(error) in THROTTLECODES: continue
+                raise error
+            self.success()
+            return results
+
+
+class USCensus_WebThrottle(USCensus_WebDelayer):
+    def __init__(self, *args, rate=60, burst=5, minimum=2, increase=1, decrease=0.5, **kwargs):
+        super().__init__('constant', *args, wait=0, **kwargs)
+        self.__budget = float(rate)
+        self.__rate = float(rate)
+        self.__burst = float(burst)
+        self.__minimum = float(minimum)
+        self.__increase = float(increase)
+        self.__decrease = float(decrease)
+        self.__tokens = float(burst)
+        self.__timestamp = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __repr__(self): return "{}(rate={}, burst={}, minimum={})".format(self.__class__.__name__, self.__budget, self.__burst, self.__minimum)
+    def __str__(self): return "{}|Rate={:.1f}/min|Budget={:.1f}/min".format(self.__class__.__name__, self.rate, self.budget)
+
+    @property
+    def rate(self): return self.__rate
+    @property
+    def budget(self): return self.__budget
+
+    def __call__(self, *args, **kwargs):
+        with INSTRUMENT('delay'):
+            wait = self.reserve()
+            if wait > 0: time.sleep(wait)
+
+    def reserve(self):
+        with self.__lock:
+            timestamp = time.monotonic()
+            self.__tokens = min(self.__burst, self.__tokens + (timestamp - self.__timestamp) * self.__rate / 60)
+            self.__timestamp = timestamp
+            self.__tokens = self.__tokens - 1
+            return max(0, -self.__tokens) * 60 / self.__rate
+
+    def success(self, *args, **kwargs):
+        with self.__lock: self.__rate = min(self.__budget, self.__rate + self.__increase)
+
+    def failure(self, error=None, *args, **kwargs):
+        if _httpcode(error) is not None and _httpcode(error) not in HTTPCODES: return
+        with self.__lock:
+            self.__rate = max(self.__minimum, self.__rate * self.__decrease)
+            self.__tokens = min(self.__tokens, 0)
+        LOGGER.warning("Throttled: {}".format(str(self)))
+
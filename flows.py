@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Migration Flow Matrices
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import logging
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_FlowMatrix', 'USCensus_FlowStore', 'flows_parser']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+np = lazy_module('numpy')
+pd = lazy_module('pandas')
+LEVELS = {'county':1, 'state':1000}
+
+
+_numeric = lambda dataframe, column: pd.to_numeric(dataframe[column], errors='coerce').to_numpy(dtype='float64')
+_filename = lambda date: 'flows_{}.npz'.format(str(date))
+
+
+def flows_parser(dataframe):
+    home = _numeric(dataframe, 'state') * 1000 + _numeric(dataframe, 'county')
+    other = _numeric(dataframe, 'STATE2') * 1000 + _numeric(dataframe, 'COUNTY2')
+    entering, exiting = _numeric(dataframe, 'MOVEDIN'), _numeric(dataframe, 'MOVEDOUT')
+    valid = ~np.isnan(home) & ~np.isnan(other)
+    inflows, outflows = valid & ~np.isnan(entering), valid & ~np.isnan(exiting)
+    origins = np.concatenate([other[inflows], home[outflows]]).astype(np.int64)
+    destinations = np.concatenate([home[inflows], other[outflows]]).astype(np.int64)
+    values = np.concatenate([entering[inflows], exiting[outflows]]).astype(np.int64)
+    return origins, destinations, values
+
+
+class USCensus_FlowMatrix(object):
+    def __init__(self, origins, destinations, values, *args, duplicates='first', **kwargs):
+        origins, destinations, values = [np.asarray(array, dtype=np.int64) for array in (origins, destinations, values)]
+        self.__codes = np.unique(np.concatenate([origins, destinations]))
+        size = len(self.__codes)
+        keys = np.searchsorted(self.__codes, origins) * size + np.searchsorted(self.__codes, destinations)
+        if duplicates == 'sum':
+            keys, inverse = np.unique(keys, return_inverse=True)
+            values = np.bincount(inverse, weights=values, minlength=len(keys)).astype(np.int64)
+        else:
+            keys, first = np.unique(keys, return_index=True)
+            values = values[first]
+        self.__rows, self.__columns, self.__values = keys // size, keys % size, values
+        self.__rowptr = np.searchsorted(self.__rows, np.arange(size + 1))
+        self.__order = np.argsort(self.__columns, kind='stable')
+        self.__columnptr = np.searchsorted(self.__columns[self.__order], np.arange(size + 1))
+        self.__aggregates = {}
+
+    def __repr__(self): return "{}(codes={}, flows={})".format(self.__class__.__name__, len(self.__codes), len(self))
+    def __len__(self): return len(self.__values)
+    def __contains__(self, code): return self.position(code) is not None
+
+    @property
+    def codes(self): return self.__codes
+    @property
+    def shape(self): return (len(self.__codes), len(self.__codes))
+    @property
+    def origins(self): return self.__codes[self.__rows]
+    @property
+    def destinations(self): return self.__codes[self.__columns]
+    @property
+    def values(self): return self.__values
+
+    def position(self, code):
+        position = int(np.searchsorted(self.__codes, int(code)))
+        return position if position < len(self.__codes) and self.__codes[position] == int(code) else None
+
+    def outflow(self, code):
+        position = self.position(code)
+        if position is None: return pd.Series([], index=pd.Index([], dtype=np.int64, name='destination'), dtype=np.int64, name='outflow')
+        indexes = slice(self.__rowptr[position], self.__rowptr[position + 1])
+        return pd.Series(self.__values[indexes], index=pd.Index(self.__codes[self.__columns[indexes]], name='destination'), name='outflow')
+
+    def inflow(self, code):
+        position = self.position(code)
+        if position is None: return pd.Series([], index=pd.Index([], dtype=np.int64, name='origin'), dtype=np.int64, name='inflow')
+        indexes = self.__order[self.__columnptr[position]:self.__columnptr[position + 1]]
+        return pd.Series(self.__values[indexes], index=pd.Index(self.__codes[self.__rows[indexes]], name='origin'), name='inflow')
+
+    def net(self, code):
+        inflow, outflow = self.inflow(code), self.outflow(code)
+        inflow.index.name, outflow.index.name = 'geography', 'geography'
+        return inflow.sub(outflow, fill_value=0).astype(np.int64).rename('net')
+
+    def totals(self):
+        inflow = np.bincount(self.__columns, weights=self.__values, minlength=len(self.__codes)).astype(np.int64)
+        outflow = np.bincount(self.__rows, weights=self.__values, minlength=len(self.__codes)).astype(np.int64)
+        return pd.DataFrame({'inflow':inflow, 'outflow':outflow, 'net':inflow - outflow}, index=pd.Index(self.__codes, name='geography'))
+
+    def aggregate(self, level):
+        divisor = LEVELS[level]
+        if divisor == 1: return self
+        try: return self.__aggregates[level]
+        except KeyError: return self.__aggregates.setdefault(level, self.__class__(self.origins // divisor, self.destinations // divisor, self.__values, duplicates='sum'))
+
+    def save(self, file):
+        np.savez_compressed(file, origins=self.origins, destinations=self.destinations, values=self.__values)
+
+    @classmethod
+    def load(cls, file):
+        with np.load(file) as contents: return cls(contents['origins'], contents['destinations'], contents['values'])
+
+
+class USCensus_FlowStore(object):
+    def __init__(self, directory, *args, **kwargs):
+        self.__directory = directory
+        self.__matrices = {}
+
+    def __repr__(self): return "{}(directory='{}')".format(self.__class__.__name__, self.__directory)
+    def __contains__(self, date): return str(date) in self.__matrices or os.path.isfile(self.file(date))
+
+    @property
+    def directory(self): return self.__directory
+    @property
+    def dates(self):
+        files = os.listdir(self.__directory) if os.path.isdir(self.__directory) else []
+        return sorted([file[len('flows_'):-len('.npz')] for file in files if file.startswith('flows_') and file.endswith('.npz')])
+
+    def file(self, date): return os.path.join(self.__directory, _filename(date))
+
+    def __setitem__(self, date, matrix):
+        os.makedirs(self.__directory, exist_ok=True)
+        temporary = os.path.join(self.__directory, '.{}.tmp.npz'.format(_filename(date)))
+        matrix.save(temporary)
+        os.replace(temporary, self.file(date))
+        self.__matrices[str(date)] = matrix
+
+    def __getitem__(self, date):
+        try: return self.__matrices[str(date)]
+        except KeyError:
+            if not os.path.isfile(self.file(date)): raise KeyError(date)
+            return self.__matrices.setdefault(str(date), USCensus_FlowMatrix.load(self.file(date)))
+
+    def inflows(self, code, *args, dates=None, level='county', **kwargs): return self.flows('inflow', code, dates=dates, level=level)
+    def outflows(self, code, *args, dates=None, level='county', **kwargs): return self.flows('outflow', code, dates=dates, level=level)
+    def nets(self, code, *args, dates=None, level='county', **kwargs): return self.flows('net', code, dates=dates, level=level)
+
+    def flows(self, direction, code, *args, dates=None, level='county', **kwargs):
+        dates = [str(date) for date in dates] if dates is not None else self.dates
+        series = [getattr(self[date].aggregate(level), direction)(code).rename_axis('geography').rename('movers').reset_index().assign(date=date) for date in dates]
+        if not series: return pd.DataFrame(columns=['date', 'geography', 'movers'])
+        return pd.concat(series, ignore_index=True)[['date', 'geography', 'movers']]
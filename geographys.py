@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Vectorized Geography
+@author: Jack Kirby Cook
+
+"""
+
+import re
+import logging
+
+from webscraping.webvariables import Geography
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['geography_series']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+pd = lazy_module('pandas')
+SENTINEL = re.compile(r'\x00([NV])(\d+)\x00')
+
+
+_name = lambda index: '\x00N{}\x00'.format(index)
+_value = lambda index: '\x00V{}\x00'.format(index)
+_geography = lambda keys, name, values: str(Geography(keys=list(keys), names=str(name).split(', ')[::-1], values=list(values)))
+
+
+def _template(keys):
+    prototype = str(Geography(keys=list(keys), names=[_name(index) for index in range(len(keys))], values=[_value(index) for index in range(len(keys))]))
+    segments = SENTINEL.split(prototype)
+    literals, fields = segments[0::3], list(zip(segments[1::3], [int(index) for index in segments[2::3]]))
+    if {(field, index) for field, index in fields} != {(field, index) for field in ('N', 'V') for index in range(len(keys))}: return None
+    return literals, fields
+
+
+def _vectorized(dataframe, template, *args, keys, names, values, **kwargs):
+    literals, fields = template
+    splits = dataframe[names].astype(str).str.split(', ', expand=True)
+    splits = splits.iloc[:, ::-1].reset_index(drop=True)
+    columns = {'N':[splits.iloc[:, index] for index in range(len(keys))], 'V':[dataframe[value].astype(str).reset_index(drop=True) for value in values]}
+    results = pd.Series(literals[0], index=splits.index)
+    for literal, (field, index) in zip(literals[1:], fields): results = results + columns[field][index] + literal
+    return results.to_numpy()
+
+
+def geography_series(dataframe, *args, keys, names, values, **kwargs):
+    columns = [names, *values]
+    if dataframe.empty: return pd.Series([], index=dataframe.index, dtype=object)
+    uniques = dataframe[columns].drop_duplicates(ignore_index=True)
+    results = pd.Series(None, index=uniques.index, dtype=object)
+    counts = uniques[names].astype(str).str.count(', ') + 1
+    template = _template(keys)
+    vectorize = (counts == len(keys)) if template is not None else pd.Series(False, index=uniques.index)
+    if vectorize.any(): 
+        results[vectorize] = _vectorized(uniques[vectorize], template, keys=keys, names=names, values=values)
+        row = uniques[vectorize].iloc[0]
+        if results[vectorize].iloc[0] != _geography(keys, row[names], row[values]): vectorize[:] = False
+    if (~vectorize).any(): results[~vectorize] = [_geography(keys, row[0], row[1:]) for row in uniques[~vectorize].itertuples(index=False, name=None)]
+    lookup = pd.Series(results.to_numpy(), index=pd.MultiIndex.from_frame(uniques))
+    return pd.Series(lookup.reindex(pd.MultiIndex.from_frame(dataframe[columns])).to_numpy(), index=dataframe.index)
+
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Pipeline Instrumentation
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import io
+import time
+import json
+import threading
+import logging
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebInstrument', 'INSTRUMENT']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+COUNTERS = ['calls', 'seconds', 'rows', 'bytes']
+cProfile = lazy_module('cProfile')
+pstats = lazy_module('pstats')
+
+
+_query = lambda query: '|'.join(['{}={}'.format(key, value) for key, value in query.items()]) if query else None
+_rounded = lambda x: {key:(round(value, 6) if isinstance(value, float) else value) for key, value in x.items()}
+
+
+class USCensus_WebNullStage(object):
+    def __enter__(self): return self
+    def __exit__(self, *args): pass
+    def update(self, **counters): pass
+
+
+class USCensus_WebStage(object):
+    def __init__(self, instrument, stage, counters):
+        self.__instrument = instrument
+        self.__stage = stage
+        self.__counters = counters
+        self.__children = 0
+        self.__start = None
+
+    def update(self, **counters):
+        for key, value in counters.items(): self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def child(self, seconds): self.__children += seconds
+
+    def __enter__(self):
+        self.__instrument.stack.append(self)
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        elapsed = time.perf_counter() - self.__start
+        stack = self.__instrument.stack
+        index = len(stack) - 1 - stack[::-1].index(self)
+        del stack[index]
+        if index > 0: stack[index - 1].child(elapsed)
+        self.__instrument.record(self.__stage, elapsed - self.__children, **self.__counters)
+
+
+class USCensus_WebQuery(object):
+    def __init__(self, instrument, query, profile=False, final=True):
+        self.__instrument = instrument
+        self.__query = query
+        self.__final = final
+        self.__profiler = cProfile.Profile() if profile else None
+        self.__previous = None
+
+    def __enter__(self):
+        self.__previous = self.__instrument.query
+        self.__instrument.query = self.__query
+        if self.__profiler is not None: self.__profiler.enable()
+        return self
+
+    def __exit__(self, *args):
+        if self.__profiler is not None:
+            self.__profiler.disable()
+            self.__instrument.profiled(self.__query, self.__profiler)
+        if self.__final: self.__instrument.finished(self.__query)
+        self.__instrument.query = self.__previous
+
+
+NULLSTAGE = USCensus_WebNullStage()
+
+
+class USCensus_WebInstrument(object):
+    def __init__(self, *args, **kwargs):
+        self.__enabled = False
+        self.__file = None
+        self.__profile = None
+        self.__count = 0
+        self.__stages = {}
+        self.__querys = {}
+        self.__counters = {}
+        self.__querycounters = {}
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+    def __repr__(self): return "{}(enabled={}, file={})".format(self.__class__.__name__, self.__enabled, self.__file)
+    def __str__(self): return "{}|{}".format(self.__class__.__name__, '|'.join(['{}={:.3f}s'.format(stage, counters['seconds']) for stage, counters in self.__stages.items()]))
+    def __bool__(self): return self.__enabled
+
+    @property
+    def enabled(self): return self.__enabled
+    @property
+    def stack(self):
+        try: return self.__local.stack
+        except AttributeError:
+            self.__local.stack = []
+            return self.__local.stack
+
+    @property
+    def query(self): return getattr(self.__local, 'query', None)
+    @query.setter
+    def query(self, query): self.__local.query = query
+
+    def configure(self, *args, file=None, profile=None, **kwargs):
+        self.__enabled = True
+        self.__file = file
+        self.__profile = int(profile) if profile is not None else None
+
+    def __call__(self, stage, **counters):
+        if not self.__enabled: return NULLSTAGE
+        return USCensus_WebStage(self, stage, counters)
+
+    def querying(self, query, *args, tag=False, **kwargs):
+        if not self.__enabled: return NULLSTAGE
+        if tag: return USCensus_WebQuery(self, _query(query), final=False)
+        with self.__lock:
+            self.__count += 1
+            profile = self.__count == self.__profile
+        return USCensus_WebQuery(self, _query(query), profile=profile)
+
+    def count(self, counter, value=1):
+        if not self.__enabled: return
+        query = self.query
+        with self.__lock:
+            for counters in (self.__counters, self.__querycounters.setdefault(query, {})): counters[counter] = counters.get(counter, 0) + value
+
+    def record(self, stage, seconds, **counters):
+        query = self.query
+        with self.__lock:
+            for records in (self.__stages, self.__querys.setdefault(query, {})):
+                record = records.setdefault(stage, {counter:0 for counter in COUNTERS})
+                record['calls'] += 1
+                record['seconds'] += seconds
+                for key, value in counters.items(): record[key] = record.get(key, 0) + value
+
+    def finished(self, query):
+        with self.__lock:
+            stages = {stage:_rounded(record) for stage, record in self.__querys.get(query, {}).items()}
+            counters = dict(self.__querycounters.get(query, {}))
+        LOGGER.info(json.dumps({'instrument':'query', 'query':query, 'stages':stages, 'counters':counters}))
+
+    def profiled(self, query, profiler):
+        if self.__file is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.__file)), exist_ok=True)
+            profiler.dump_stats('{}.prof'.format(os.path.splitext(self.__file)[0]))
+        contents = io.StringIO()
+        pstats.Stats(profiler, stream=contents).sort_stats('cumulative').print_stats(25)
+        LOGGER.info("Profiled: {}\n{}".format(query, contents.getvalue()))
+
+    def summary(self):
+        with self.__lock:
+            stages = {stage:_rounded(record) for stage, record in self.__stages.items()}
+            querys = {query:{'query':query, 'stages':{stage:_rounded(record) for stage, record in records.items()}, 'counters':{}} for query, records in self.__querys.items()}
+            for query, counters in self.__querycounters.items(): querys.setdefault(query, {'query':query, 'stages':{}, 'counters':{}})['counters'] = dict(counters)
+            querys = list(querys.values())
+            return {'stages':stages, 'querys':querys, 'counters':dict(self.__counters)}
+
+    def dump(self):
+        if not self.__enabled: return
+        summary = self.summary()
+        LOGGER.info(json.dumps({'instrument':'summary', 'stages':summary['stages'], 'counters':summary['counters']}))
+        if self.__file is None: return
+        os.makedirs(os.path.dirname(os.path.abspath(self.__file)), exist_ok=True)
+        with open(self.__file, 'w') as file: json.dump(summary, file, indent=2)
+
+
+INSTRUMENT = USCensus_WebInstrument()
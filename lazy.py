@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Lazy Imports
+@author: Jack Kirby Cook
+
+"""
+
+import importlib
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_LazyModule', 'lazy_module']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+class USCensus_LazyModule(object):
+    def __init__(self, name):
+        self.__name = name
+        self.__module = None
+
+    def __repr__(self): return "{}('{}', loaded={})".format(self.__class__.__name__, self.__name, self.__module is not None)
+
+    def __getattr__(self, attribute):
+        if self.__module is None: self.__module = importlib.import_module(self.__name)
+        return getattr(self.__module, attribute)
+
+
+def lazy_module(name): return USCensus_LazyModule(name)
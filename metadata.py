@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Metadata Cache
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import pickle
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+
+from uscensus.instrument import INSTRUMENT
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_MetadataCache']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+_key = lambda *args: tuple(str(arg) if arg is not None else None for arg in args)
+_filename = lambda key: '{}.pkl'.format(hashlib.sha1(repr(key).encode('utf-8')).hexdigest())
+
+
+class USCensus_MetadataCache(object):
+    def __init__(self, directory, *args, size=256, **kwargs):
+        self.__directory = directory
+        self.__size = int(size)
+        self.__memory = OrderedDict()
+        self.__lock = threading.RLock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __repr__(self): return "{}(directory='{}', size={})".format(self.__class__.__name__, self.__directory, self.__size)
+    def __str__(self): return "{}|Hits={}|Misses={}|Memory={}".format(self.__class__.__name__, self.hits, self.misses, len(self))
+    def __len__(self): return len(self.__memory)
+    def __contains__(self, key): return _key(*key) in self.__memory or os.path.isfile(self.file(*key))
+
+    @property
+    def directory(self): return self.__directory
+    @property
+    def hits(self): return self.__hits
+    @property
+    def misses(self): return self.__misses
+
+    def file(self, date, endpoint, parent=None): return os.path.join(self.__directory, str(date), _filename(_key(date, endpoint, parent)))
+
+    def __call__(self, date, endpoint, parent=None, *args, function, **kwargs):
+        key = _key(date, endpoint, parent)
+        with self.__lock:
+            try:
+                value = self.get(key)
+                self.__hits += 1
+                INSTRUMENT.count('metadata.hits')
+                return value
+            except KeyError:
+                self.__misses += 1
+                INSTRUMENT.count('metadata.misses')
+        value = function()
+        with self.__lock: self.set(key, value)
+        return value
+
+    def get(self, key):
+        if key in self.__memory:
+            self.__memory.move_to_end(key)
+            return self.__memory[key]
+        file = self.file(*key)
+        if not os.path.isfile(file): raise KeyError(key)
+        with open(file, 'rb') as contents: value = pickle.load(contents)
+        self.remember(key, value)
+        return value
+
+    def set(self, key, value):
+        file = self.file(*key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with open(file + '.tmp', 'wb') as contents: pickle.dump(value, contents)
+        os.replace(file + '.tmp', file)
+        self.remember(key, value)
+
+    def remember(self, key, value):
+        self.__memory[key] = value
+        self.__memory.move_to_end(key)
+        while len(self.__memory) > self.__size: self.__memory.popitem(last=False)
+
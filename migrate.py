@@ -11,7 +11,7 @@ import os.path
 import time
 import warnings
 import logging
-import pandas as pd
+from functools import lru_cache
 
 DIR = os.path.dirname(os.path.realpath(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(DIR, os.pardir))
@@ -19,6 +19,11 @@ RES_DIR = os.path.join(ROOT_DIR, 'resources')
 SAVE_DIR = os.path.join(ROOT_DIR, 'save')
 REPOSITORY_DIR = os.path.join(SAVE_DIR, 'uscensus')
 REPORT_FILE = os.path.join(SAVE_DIR, 'uscensus', 'acs.csv')
+METADATA_DIR = os.path.join(SAVE_DIR, 'metadata', 'uscensus')
+INSTRUMENT_DIR = os.path.join(SAVE_DIR, 'instrument', 'uscensus')
+STORE_DIR = os.path.join(SAVE_DIR, 'parquet', 'uscensus')
+FLOWS_DIR = os.path.join(SAVE_DIR, 'flows', 'uscensus')
+REFRESH_DIR = os.path.join(SAVE_DIR, 'refresh', 'uscensus')
 APIKEYS_FILE = os.path.join(RES_DIR, 'apikeys.txt')
 TABLES_FILE = os.path.join(DIR, 'tables.csv')
 if not ROOT_DIR in sys.path: sys.path.append(ROOT_DIR)
@@ -26,14 +31,28 @@ if not ROOT_DIR in sys.path: sys.path.append(ROOT_DIR)
 from utilities.input import InputParser
 from webscraping.webapi import WebURL, WebCache, WebQueue, WebDownloader
 from webscraping.webreaders import WebReader, Retrys
-from webscraping.webtimers import WebDelayer
 from webscraping.webpages import WebJsonPage, WebContents
 from webscraping.webdata import WebJson
 from webscraping.webvariables import Geography
+from uscensus.metadata import USCensus_MetadataCache
+from uscensus.instrument import INSTRUMENT
+from uscensus.delayers import USCensus_WebDelayer, USCensus_WebThrottle, RETRYCODES
+from uscensus.concurrency import USCensus_WebEngine
+from uscensus.geographys import geography_series
+from uscensus.datatypes import typed_parser
+from uscensus.storage import USCensus_WebStore
+from uscensus.streaming import USCensus_WebStream
+from uscensus.processing import USCensus_WebProcessor
+from uscensus.refresh import USCensus_WebManifest, USCensus_WebRefresh
+from uscensus.flows import USCensus_FlowMatrix, USCensus_FlowStore, flows_parser
+from uscensus.lazy import lazy_module
+
+np = lazy_module('numpy')
+pd = lazy_module('pandas')
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ['USCensus_ACS_WebDelayer', 'USCensus_ACS_WebDownloader', 'USCensus_ACS_WebQueue']
+__all__ = ['USCensus_ACS_WebDelayer', 'USCensus_ACS_WebThrottle', 'USCensus_ACS_WebDownloader', 'USCensus_ACS_WebAsyncDownloader', 'USCensus_ACS_WebQueue']
 __copyright__ = "Copyright 2020, Jack Kirby Cook"
 __license__ = ""
 
@@ -42,9 +61,8 @@ LOGGER = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")    
 
 
-with open(APIKEYS_FILE) as file: APIKEYS = {line.split(',')[0]:line.split(',')[1] for line in file.readlines()}
-
 GEOGRAPHYS = {'state':'state', 'county':'county', 'subdivision':'county subdivision'}
+FLOWS = ['MOVEDIN', 'MOVEDOUT', 'STATE2', 'COUNTY2']
 TAGS = {'growth':'MOVEDNET', 'entering':'MOVEDIN', 'exiting':'MOVEDOUT', 'targetname':'FULL2_NAME', 'targetstate':'STATE2', 'targetcounty':'COUNTY2', 'name':'FULL1_NAME'}
 STATES = {
     'AL':'Alabama', 'AK':'Alaska','AZ':'Arizona', 'AR':'Arkansas', 'CA':'California', 'CO':'Colorado', 'CT':'Connecticut', 'DE':'Delaware', 'FL':'Florida', 'GA':'Georgia', 
@@ -58,26 +76,42 @@ _inverted = lambda x: {v:k for k, v in x.items()}
 _filter = lambda x: [i for i in x if i is not None]
 _range = lambda x: [str(i) for i in range(int(x.split('-')[0]), int(x.split('-')[1])+1)]
 _list = lambda x: [str(i) for i in str(x).split('|')]
+_bool = lambda x: str(x).lower() in ('true', 'yes', '1')
 _state = lambda x: str(x) if str(x) in STATES.values() else STATES[str(x)]
 _county = lambda x: ' '.join([str(x), 'County']) if not str(x).endswith(' County') else str(x)
 _tag = lambda *args: {'get':'{}'.format(','.join(list(args)))}
 _forgeo = lambda **kwargs: {'for':'{}'.format('%20'.join([':'.join([key, value]) for key, value in kwargs.items()]))} if kwargs else {}
 _ingeo = lambda **kwargs: {'in':'{}'.format('%20'.join([':'.join([key, value]) for key, value in kwargs.items()]))} if kwargs else {}
 _apikey = lambda apikey: {'key':'{}'.format(str(apikey))}
+
+
+@lru_cache(maxsize=None)
+def load_apikeys():
+    with open(APIKEYS_FILE) as file: return {line.split(',')[0]:line.split(',')[1] for line in file.readlines()}
+
+def __getattr__(name):
+    if name == 'APIKEYS': return load_apikeys()
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
     
 
 geodata_xpath = lambda x: x
 vardata_xpath = lambda x: x
 
 
-def geodata_parser(x): return {i[0].split(', ')[0]:i[-1] for i in list(x)[1:]}
-def vardata_parser(x): return pd.DataFrame(data=list(x)[1:], columns=list(x)[0])    
+def geodata_parser(x): 
+    rows = iter(x)
+    key = next(rows)[-1]
+    return {(key, str(row[0]).split(', ')[0]):row[-1] for row in rows}
+def vardata_parser(x): 
+    rows = iter(x)
+    return pd.DataFrame.from_records(rows, columns=next(rows))
 
 class USCensus_WebGeoData(WebJson.update(dataparser=geodata_parser), xpath=geodata_xpath): pass
 class USCensus_WebVarData(WebJson.update(dataparser=vardata_parser), xpath=vardata_xpath): pass
 
-class USCensus_ACS_WebDelayer(WebDelayer): pass
-class USCensus_ACS_WebReader(WebReader, retrys=Retrys(retries=3, backoff=0.3, httpcodes=(500, 502, 504)), authenticate=None): pass
+class USCensus_ACS_WebDelayer(USCensus_WebDelayer): pass
+class USCensus_ACS_WebThrottle(USCensus_WebThrottle): pass
+class USCensus_ACS_WebReader(WebReader, retrys=Retrys(retries=3, backoff=0.3, httpcodes=RETRYCODES), authenticate=None): pass
 
 
 class USCensus_ACS_WebURL(WebURL, protocol='https', domain='api.census.gov', spaceproxy='%20'): 
@@ -95,29 +129,45 @@ class USCensus_ACS_WebContents(WebContents):
 
 
 class USCensus_ACS_WebPage(WebJsonPage, contents=USCensus_ACS_WebContents):
+    def __init__(self, *args, delayer, **kwargs):
+        super().__init__(*args, delayer=delayer, **kwargs)
+        self.__delayer = delayer
+
+    def request(self, url, *args, **kwargs):
+        with INSTRUMENT('transfer'): webpage = self.__delayer.attempt(self.load, url, *args, referer=None, **kwargs)
+        with INSTRUMENT('parse'): return webpage.setup()
+
     def setup(self, *args, **kwargs): 
         for content in iter(self.load): content(*args, **kwargs)
         if self.empty: self.show()
     
-    def execute(self, *args, date, state, county, **kwargs): 
+    def execute(self, *args, **kwargs): 
+        dataframe = self[USCensus_ACS_WebContents.VARDATA].data()
+        yield self.reshape(dataframe, *args, **kwargs)
+
+    @classmethod
+    def reshape(cls, dataframe, *args, date, state, county, typed=False, **kwargs):
         query = {'date':date, 'state':state, 'county':county}
         dataset = '{}_{}_{}'.format('household', 'geography', 'mitgration')
-        dataframe = self[USCensus_ACS_WebContents.VARDATA].data()
-        dataframe = self.geography(*args, **kwargs)
-        dataframe = self.variables(*args, **kwargs)
+        with INSTRUMENT('variables', rows=len(dataframe)): dataframe = cls.variables(dataframe, *args, **kwargs)
+        if typed:
+            with INSTRUMENT('typed', rows=len(dataframe)): dataframe = typed_parser(dataframe, numerics=['growth', 'entering', 'exiting'], categoricals=['state', 'county', 'county subdivision', 'targetstate', 'targetcounty'])
+        with INSTRUMENT('geography', rows=len(dataframe)): dataframe = cls.geography(dataframe, *args, **kwargs)
+        dataframe = dataframe[['growth', 'entering', 'exiting', 'geography', 'target']]
         dataframe['date'] = date
-        yield query, dataset, dataframe
+        if typed: dataframe = typed_parser(dataframe, categoricals=['geography', 'target', 'date'])
+        return query, dataset, dataframe
 
-    def geography(self, dataframe, *args, **kwargs):
+    @staticmethod
+    def geography(dataframe, *args, **kwargs):
         dataframe.rename(_inverted(GEOGRAPHYS), axis=1, inplace=True)
-        function = lambda x, keys, names, values: str(Geography(keys=keys, names=x.to_dict()[names].split(', ')[::-1], values=[x.to_dict()[value] for value in values]))
-        dataframe['geography'] = dataframe.apply(function, result_type='reduce', axis=1, args=(['state', 'county', 'subdivision'], 'name', ['state', 'county', 'subdivision']))
-        dataframe['target'] = dataframe.apply(function, result_type='reduce', axis=1, args=(['state', 'county'], 'targetname', ['targestate', 'targetcounty']))
+        dataframe['geography'] = geography_series(dataframe, keys=['state', 'county', 'subdivision'], names='name', values=['state', 'county', 'subdivision'])
+        dataframe['target'] = geography_series(dataframe, keys=['state', 'county'], names='targetname', values=['targetstate', 'targetcounty'])
         return dataframe
 
-    def variables(self, dataframe, *args, **kwargs):
+    @staticmethod
+    def variables(dataframe, *args, **kwargs):
         dataframe.rename(_inverted(TAGS), axis=1, inplace=True)
-        dataframe = dataframe[['growth', 'entering', 'exiting', 'geography', 'target']](dataframe, *args, **kwargs) 
         return dataframe
 
 
@@ -129,46 +179,174 @@ class USCensus_ACS_WebQueue(WebQueue, querys=['date', 'state', 'county']):
 
 
 class USCensus_ACS_WebDownloader(WebDownloader, delay=25, attempts=10): 
-    def execute(self, *args, queue, delayer, **kwargs):
-        with USCensus_ACS_WebReader() as session:
+    def execute(self, *args, queue, delayer, metadata, store=None, typed=False, streaming=False, processes=None, refresh=None, **kwargs):
+        if streaming and store is None: raise ValueError('Streaming requires a store to write into')
+        if streaming and processes: raise ValueError('Streaming and processes are exclusive')
+        if refresh is not None and (streaming or processes): raise ValueError('Refresh is exclusive with streaming and processes')
+        with USCensus_ACS_WebReader() as session, USCensus_WebStream(delayer=delayer) as webstream, USCensus_WebProcessor(processes=processes) as webprocessor:
             webpage = USCensus_ACS_WebPage(session, delayer=delayer) 
+            if refresh is not None:
+                with refresh:
+                    for feedquery in iter(queue):
+                        with INSTRUMENT.querying(feedquery):
+                            for webcache in self.refresh(webpage, refresh, feedquery, metadata=metadata, store=store, typed=typed):
+                                with INSTRUMENT('write'): yield webcache
+                return
+            if processes:
+                plans = ((feedquery, geography) for feedquery in iter(queue) for geography in self.geographys(webpage, metadata, **feedquery))
+                for webcache in self.process(webpage, webprocessor, plans, store=store, typed=typed):
+                    with INSTRUMENT('write'): yield webcache
+                return
             for feedquery in iter(queue):
-                for geography in self.geographys(webpage, **feedquery):
-                    url = USCensus_ACS_WebURL(dataset='flows', tags=list(TAGS.values()), geography=geography, date=feedquery['date'], apikey=APIKEYS['uscensus'])
-                    webpage.load(url, referer=None).setup()
-                    for query, dataset, dataframe in webpage(**feedquery): yield USCensus_ACS_WebCache(query, {dataset:dataframe})
-                        
-    def geographys(self, webpage, *args, date, state, county, **kwargs):
+                with INSTRUMENT.querying(feedquery):
+                    for geography in self.geographys(webpage, metadata, **feedquery):
+                        if streaming: webcaches = self.stream(webstream, (feedquery, geography), store=store, typed=typed)
+                        else: webcaches = self.split(self.fetch(webpage, (feedquery, geography)), store=store, typed=typed)
+                        for webcache in webcaches:
+                            with INSTRUMENT('write'): yield webcache
+
+    def fetch(self, webpage, plan, *args, **kwargs):
+        feedquery, geography = plan
+        url = USCensus_ACS_WebURL(dataset='flows', tags=list(TAGS.values()), geography=geography, date=feedquery['date'], apikey=load_apikeys()['uscensus'])
+        dataframe = webpage.request(url)[USCensus_ACS_WebContents.VARDATA].data()
+        return feedquery, geography, dataframe
+
+    def refresh(self, webpage, webrefresh, feedquery, *args, metadata, store=None, typed=False, **kwargs):
+        geographys = list(self.geographys(webpage, metadata, **feedquery))
+        urls = [USCensus_ACS_WebURL(dataset='flows', tags=list(TAGS.values()), geography=geography, date=feedquery['date'], apikey=load_apikeys()['uscensus']) for geography in geographys]
+        payloads = [webrefresh(url) for url in urls]
+        if not any([changed for key, entry, contents, changed in payloads]):
+            webrefresh.skip(feedquery)
+            webrefresh.commit(payloads)
+            return
+        payloads = [webrefresh(url, force=True) if payload[2] is None else payload for url, payload in zip(urls, payloads)]
+        for geography, (key, entry, contents, changed) in zip(geographys, payloads):
+            query, dataset, dataframe = USCensus_ACS_WebPage.reshape(vardata_parser(webrefresh.load(contents)), typed=typed, **feedquery)
+            file = store.append(query, dataset, dataframe, part=str(geography)) if store is not None else None
+            webrefresh.change(query, dataset, file=file)
+            yield USCensus_ACS_WebCache(query, {dataset:dataframe})
+        webrefresh.commit(payloads)
+
+    def stream(self, webstream, plan, *args, store, typed=False, **kwargs):
+        feedquery, geography = plan
+        url = USCensus_ACS_WebURL(dataset='flows', tags=list(TAGS.values()), geography=geography, date=feedquery['date'], apikey=load_apikeys()['uscensus'])
+        results = {}
+        for part, batch in enumerate(webstream(url)):
+            query, dataset, dataframe = USCensus_ACS_WebPage.reshape(batch, typed=typed, **feedquery)
+            store.append(query, dataset, dataframe, part=(str(geography), part))
+            results[tuple(query.items())] = (query, dataset, dataframe.iloc[0:0])
+        for query, dataset, dataframe in results.values(): yield USCensus_ACS_WebCache(query, {dataset:dataframe})
+
+    def process(self, webpage, webprocessor, plans, *args, store=None, typed=False, **kwargs):
+        tasks = ((str(geography), dataframe, dict(typed=typed, **feedquery)) for feedquery, geography, dataframe in (self.fetch(webpage, plan) for plan in plans))
+        for part, (query, dataset, dataframe) in webprocessor(USCensus_ACS_WebPage.reshape, tasks):
+            if store is not None: store.append(query, dataset, dataframe, part=part)
+            yield USCensus_ACS_WebCache(query, {dataset:dataframe})
+
+    def split(self, contents, *args, store=None, typed=False, **kwargs):
+        feedquery, geography, dataframe = contents
+        query, dataset, dataframe = USCensus_ACS_WebPage.reshape(dataframe, typed=typed, **feedquery)
+        if store is not None: store.append(query, dataset, dataframe, part=str(geography))
+        yield USCensus_ACS_WebCache(query, {dataset:dataframe})
+
+    def geographys(self, webpage, metadata, *args, date, state, county, **kwargs):
         geography = Geography(keys=['state'], names=[None], values=[None])
-        url = USCensus_ACS_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=APIKEYS['uscensus'])
-        states = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GEODATA].data()
-        geography = Geography(keys=['state', 'county'], names=[state, None], values=[states[state], None])
-        url = USCensus_ACS_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=APIKEYS['uscensus'])
-        countys = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GEODATA].data()
-        geography = Geography(keys=['state', 'county', 'subdivision'], names=[state, county, None], values=[states[state], countys[county], None])
-        url = USCensus_ACS_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=APIKEYS['uscensus'])
-        subdivisions = webpage.load(url, referer=None).setup()[USCensus_ACS_WebContents.GEODATA].data()
-        geographys = [Geography(keys=['state', 'county', 'subdivision'], names=[state, county, name], values=[states[state], countys[county], value]) for name, value in subdivisions.items()]
+        states = self.geovalues(webpage, metadata, geography, date=date)
+        geography = Geography(keys=['state', 'county'], names=[state, None], values=[states[('state', state)], None])
+        countys = self.geovalues(webpage, metadata, geography, date=date)
+        geography = Geography(keys=['state', 'county', 'subdivision'], names=[state, county, None], values=[states[('state', state)], countys[('county', county)], None])
+        subdivisions = self.geovalues(webpage, metadata, geography, date=date)
+        geographys = [Geography(keys=['state', 'county', 'subdivision'], names=[state, county, name], values=[states[('state', state)], countys[('county', county)], value]) for (key, name), value in subdivisions.items()]
         for geography in geographys: yield geography
 
+    def geovalues(self, webpage, metadata, geography, *args, date, **kwargs):
+        url = USCensus_ACS_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=load_apikeys()['uscensus'])
+        return metadata(date, 'NAME', str(geography), function=lambda: webpage.request(url)[USCensus_ACS_WebContents.GEODATA].data())
+
         
-def main(*args, **kwargs): 
-    webdelayer = USCensus_ACS_WebDelayer('constant', wait=15)
-    webqueue = USCensus_ACS_WebQueue(REPORT_FILE, *args, **kwargs)
-    webdownloader = USCensus_ACS_WebDownloader(REPOSITORY_DIR, REPORT_FILE, *args, queue=webqueue, delayer=webdelayer, **kwargs)
+class USCensus_ACS_WebAsyncDownloader(USCensus_ACS_WebDownloader, delay=25, attempts=10):
+    def execute(self, *args, queue, delayer, metadata, store=None, typed=False, concurrency=4, streaming=False, processes=None, **kwargs):
+        if streaming or processes: raise ValueError('Concurrency is exclusive with streaming and processes')
+        webengine = USCensus_WebEngine(USCensus_ACS_WebReader, USCensus_ACS_WebPage, delayer=delayer, concurrency=concurrency)
+        def expand(webpage, feedquery):
+            with INSTRUMENT.querying(feedquery): return [(feedquery, geography) for geography in self.geographys(webpage, metadata, **feedquery)]
+        def fetch(webpage, plan):
+            with INSTRUMENT.querying(plan[0], tag=True): return self.fetch(webpage, plan)
+        def split(contents):
+            with INSTRUMENT.querying(contents[0], tag=True): return list(self.split(contents, store=store, typed=typed))
+        plans = list(webengine(expand, lambda plans: plans, iter(queue)))
+        for webcache in webengine(fetch, split, plans):
+            with INSTRUMENT('write'): yield webcache
+
+
+class USCensus_ACS_WebFlows(object):
+    def __init__(self, *args, delayer, metadata, store, **kwargs):
+        self.__delayer = delayer
+        self.__metadata = metadata
+        self.__store = store
+
+    def __repr__(self): return "{}(store={})".format(self.__class__.__name__, repr(self.__store))
+
+    def __call__(self, *args, date=None, dates=[], state=None, states=[], **kwargs):
+        dates = [str(item) for item in [date, *dates] if item]
+        states = [_state(item) for item in [state, *states] if item]
+        with USCensus_ACS_WebReader() as session:
+            webpage = USCensus_ACS_WebPage(session, delayer=self.__delayer)
+            for date in dates:
+                with INSTRUMENT.querying({'date':date}):
+                    fipscodes = {name:value for (key, name), value in self.geovalues(webpage, Geography(keys=['state'], names=[None], values=[None]), date=date).items()}
+                    arrays = [flows_parser(self.fetch(webpage, fipscodes[name], date=date)) for name in (states if states else fipscodes.keys())]
+                    matrix = USCensus_FlowMatrix(*[np.concatenate(values) for values in zip(*arrays)])
+                    self.__store[date] = matrix
+                    yield date, matrix
+
+    def fetch(self, webpage, fipscode, *args, date, **kwargs):
+        geography = Geography(keys=['state', 'county'], names=[None, None], values=[fipscode, None])
+        url = USCensus_ACS_WebURL(dataset='flows', tags=FLOWS, geography=geography, date=date, apikey=load_apikeys()['uscensus'])
+        return webpage.request(url)[USCensus_ACS_WebContents.VARDATA].data()
+
+    def geovalues(self, webpage, geography, *args, date, **kwargs):
+        url = USCensus_ACS_WebURL(dataset='acs5', tags=['NAME'], geography=geography, date=date, apikey=load_apikeys()['uscensus'])
+        return self.__metadata(date, 'NAME', str(geography), function=lambda: webpage.request(url)[USCensus_ACS_WebContents.GEODATA].data())
+
+
+def main(*args, rate=None, concurrency=None, parquet=False, instrument=False, profile=None, flows=False, refresh=False, **kwargs): 
+    if refresh and concurrency: raise ValueError('Refresh and concurrency are exclusive')
+    if concurrency and (kwargs.get('streaming', False) or kwargs.get('processes', None)): raise ValueError('Concurrency is exclusive with streaming and processes')
+    if concurrency and not rate: raise ValueError('Concurrency requires a rate to share across its fetchers')
+    if instrument or profile is not None: INSTRUMENT.configure(file=os.path.join(INSTRUMENT_DIR, 'migrate_{}.json'.format(time.strftime('%Y%m%d%H%M%S'))), profile=profile)
+    webdelayer = USCensus_ACS_WebThrottle(rate=rate, burst=5) if rate else USCensus_ACS_WebDelayer('constant', wait=15)
+    webmetadata = USCensus_MetadataCache(METADATA_DIR, size=256)
+    if flows:
+        webflows = USCensus_ACS_WebFlows(delayer=webdelayer, metadata=webmetadata, store=USCensus_FlowStore(FLOWS_DIR))
+        for date, matrix in webflows(*args, **kwargs): LOGGER.info("Flows: {}|{}".format(date, repr(matrix)))
+        LOGGER.info(str(webmetadata))
+        LOGGER.info(str(webdelayer))
+        INSTRUMENT.dump()
+        return
+    webstore = USCensus_WebStore(STORE_DIR, integers=['growth', 'entering', 'exiting']) if parquet else None
+    webrefresh = USCensus_WebRefresh(USCensus_WebManifest(os.path.join(REFRESH_DIR, 'migrate.json')), delayer=webdelayer) if refresh else None
+    reportfile = os.path.join(REFRESH_DIR, 'migrate_{}.csv'.format(time.strftime('%Y%m%d'))) if refresh else REPORT_FILE
+    webqueue = USCensus_ACS_WebQueue(reportfile, *args, **kwargs)
+    if concurrency: webdownloader = USCensus_ACS_WebAsyncDownloader(REPOSITORY_DIR, reportfile, *args, queue=webqueue, delayer=webdelayer, metadata=webmetadata, store=webstore, concurrency=concurrency, **kwargs)
+    else: webdownloader = USCensus_ACS_WebDownloader(REPOSITORY_DIR, reportfile, *args, queue=webqueue, delayer=webdelayer, metadata=webmetadata, store=webstore, refresh=webrefresh, **kwargs)
     webdownloader(*args, **kwargs)
     while True: 
         if webdownloader.off: break
         if webdownloader.error: break
         time.sleep(15)
     LOGGER.info(str(webdownloader))
+    LOGGER.info(str(webmetadata))
+    LOGGER.info(str(webdelayer))
+    INSTRUMENT.dump()
+    if webrefresh is not None: webrefresh.report(os.path.join(REFRESH_DIR, 'migrate_{}.json'.format(time.strftime('%Y%m%d%H%M%S'))))
     for results in webdownloader.results: print(str(results))
     if not bool(webdownloader): raise webdownloader.error
 
 
 if __name__ == '__main__':    
     logging.basicConfig(level='INFO', format="[%(levelname)s, %(threadName)s]:  %(message)s")
-    inputparser = InputParser(proxys={'assign':'=', 'space':'_'}, parsers={'dates':_range, 'countys':_list}, default=str)   
+    inputparser = InputParser(proxys={'assign':'=', 'space':'_'}, parsers={'dates':_range, 'countys':_list, 'typed':_bool, 'parquet':_bool, 'streaming':_bool, 'rate':float, 'concurrency':int, 'instrument':_bool, 'profile':int, 'processes':int, 'flows':_bool, 'states':_list, 'refresh':_bool}, default=str)   
     inputparser(*sys.argv[1:])
     main(*inputparser.inputArgs, **inputparser.inputParms)  
     
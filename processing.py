@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Process Pool Post-Processing
+@author: Jack Kirby Cook
+
+"""
+
+import logging
+from collections import deque
+
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebProcessor', 'processing_worker']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+pa = lazy_module('pyarrow')
+pd = lazy_module('pandas')
+multiprocessing = lazy_module('multiprocessing')
+futures = lazy_module('concurrent.futures')
+shared_memory = lazy_module('multiprocessing.shared_memory')
+resource_tracker = lazy_module('multiprocessing.resource_tracker')
+
+
+class USCensus_SharedFrame(object):
+    def __init__(self, name, size): self.name, self.size = name, size
+    def __reduce__(self): return (self.__class__, (self.name, self.size))
+
+
+def _untracked(*args, **kwargs):
+    try: return shared_memory.SharedMemory(*args, track=False, **kwargs)
+    except TypeError:
+        memory = shared_memory.SharedMemory(*args, **kwargs)
+        resource_tracker.unregister(memory._name, 'shared_memory')
+        return memory
+
+
+def _write(table, memory):
+    with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(memory.buf)), table.schema) as writer: writer.write_table(table)
+
+
+def share(dataframe, *args, tracked=True, **kwargs):
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer: writer.write_table(table)
+    size = max(sink.size(), 1)
+    memory = shared_memory.SharedMemory(create=True, size=size) if tracked else _untracked(create=True, size=size)
+    _write(table, memory)
+    return memory, size
+
+
+def unshare(name, size, *args, owner=False, **kwargs):
+    memory = shared_memory.SharedMemory(name=name)
+    if owner: memory.unlink()
+    contents = pa.foreign_buffer(pa.py_buffer(memory.buf).address, size, base=memory)
+    return pa.ipc.open_stream(contents).read_all().to_pandas()
+
+
+def processing_worker(function, name, size, parameters):
+    results = function(unshare(name, size), **parameters)
+    results = results if isinstance(results, tuple) else (results,)
+    shared = []
+    for value in results:
+        if not isinstance(value, pd.DataFrame):
+            shared.append(value)
+            continue
+        memory, size = share(value, tracked=False)
+        memory.close()
+        shared.append(USCensus_SharedFrame(memory.name, size))
+    return tuple(shared)
+
+
+class USCensus_WebProcessor(object):
+    def __init__(self, *args, processes=None, depth=8, **kwargs):
+        self.__processes = int(processes) if processes else None
+        self.__depth = int(depth)
+        self.__executor = None
+
+    def __repr__(self): return "{}(processes={}, depth={})".format(self.__class__.__name__, self.__processes, self.__depth)
+    def __enter__(self): return self
+
+    def __exit__(self, *args):
+        if self.__executor is not None: self.__executor.shutdown(wait=True, cancel_futures=True)
+        self.__executor = None
+
+    @property
+    def executor(self):
+        if self.__executor is None: self.__executor = futures.ProcessPoolExecutor(max_workers=self.__processes, mp_context=multiprocessing.get_context('spawn'))
+        return self.__executor
+
+    def __call__(self, function, tasks, *args, **kwargs):
+        pending = deque()
+        try:
+            for key, dataframe, parameters in tasks:
+                if len(pending) >= self.__depth: yield self.result(*pending.popleft())
+                memory, size = share(dataframe)
+                try: future = self.executor.submit(processing_worker, function, memory.name, size, parameters)
+                except BaseException as error:
+                    self.release(memory)
+                    raise error
+                pending.append((key, memory, future))
+            while pending: yield self.result(*pending.popleft())
+        finally:
+            for key, memory, future in pending:
+                if not future.cancel(): self.discard(future)
+                self.release(memory)
+
+    def result(self, key, memory, future):
+        try: results = future.result()
+        finally: self.release(memory)
+        return key, tuple(unshare(value.name, value.size, owner=True) if isinstance(value, USCensus_SharedFrame) else value for value in results)
+
+    @staticmethod
+    def discard(future):
+        try: results = future.result()
+        except BaseException: return
+        for value in [value for value in results if isinstance(value, USCensus_SharedFrame)]: USCensus_WebProcessor.release(shared_memory.SharedMemory(name=value.name))
+
+    @staticmethod
+    def release(memory):
+        memory.close()
+        memory.unlink()
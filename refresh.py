@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Incremental Refresh
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import re
+import json
+import time
+import hashlib
+import threading
+import logging
+
+from uscensus.instrument import INSTRUMENT
+from uscensus.delayers import retrying_session
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebManifest', 'USCensus_WebRefresh']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+APIKEY = re.compile(r'[?&]key=[^&]*')
+
+
+_key = lambda url: hashlib.sha1(APIKEY.sub('', str(url)).encode('utf-8')).hexdigest()
+_hash = lambda content: hashlib.sha256(content).hexdigest()
+
+
+class USCensus_WebManifest(object):
+    def __init__(self, file, *args, size=50, **kwargs):
+        self.__file = file
+        self.__size = int(size)
+        self.__pending = 0
+        self.__lock = threading.RLock()
+        if os.path.isfile(file):
+            with open(file, 'r') as contents: self.__entries = json.load(contents)
+        else: self.__entries = {}
+
+    def __repr__(self): return "{}(file='{}')".format(self.__class__.__name__, self.__file)
+    def __len__(self): return len(self.__entries)
+    def __contains__(self, key): return key in self.__entries
+    def __getitem__(self, key): return dict(self.__entries.get(key, {}))
+
+    def update(self, key, entry):
+        with self.__lock:
+            self.__entries[key] = dict(entry)
+            self.__pending += 1
+            if self.__pending >= self.__size: self.save()
+
+    def save(self):
+        with self.__lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.__file)), exist_ok=True)
+            temporary = os.path.join(os.path.dirname(os.path.abspath(self.__file)), '.{}.tmp'.format(os.path.basename(self.__file)))
+            with open(temporary, 'w') as contents: json.dump(self.__entries, contents)
+            os.replace(temporary, self.__file)
+            self.__pending = 0
+
+
+class USCensus_WebRefresh(object):
+    def __init__(self, manifest, *args, delayer, **kwargs):
+        self.__manifest = manifest
+        self.__delayer = delayer
+        self.__retrys = kwargs
+        self.__session = None
+        self.__changed = []
+        self.__unchanged = []
+        self.__lock = threading.Lock()
+
+    def __repr__(self): return "{}(manifest={})".format(self.__class__.__name__, repr(self.__manifest))
+    def __str__(self): return "{}|Changed={}|Unchanged={}".format(self.__class__.__name__, len(self.__changed), len(self.__unchanged))
+
+    @property
+    def changed(self): return list(self.__changed)
+    @property
+    def unchanged(self): return list(self.__unchanged)
+
+    def __enter__(self):
+        self.__session = retrying_session(**self.__retrys)
+        return self
+
+    def __exit__(self, *args):
+        self.__session.close()
+        self.__session = None
+        self.__manifest.save()
+
+    def request(self, url, *args, headers={}, **kwargs):
+        self.__delayer()
+        response = self.__session.get(str(url), headers=headers)
+        if response.status_code != 304: response.raise_for_status()
+        return response
+
+    def __call__(self, url, *args, force=False, **kwargs):
+        key, previous = _key(url), self.__manifest[_key(url)]
+        headers = {} if force else {header:previous[field] for header, field in (('If-None-Match', 'etag'), ('If-Modified-Since', 'modified')) if previous.get(field)}
+        with INSTRUMENT('transfer') as stage:
+            response = self.__delayer.attempt(self.request, url, headers=headers)
+            stage.update(bytes=len(response.content))
+        if response.status_code == 304: return key, dict(previous, checked=time.strftime('%Y-%m-%dT%H:%M:%S')), None, False
+        entry = {'sha256':_hash(response.content), 'etag':response.headers.get('ETag'), 'modified':response.headers.get('Last-Modified'), 'size':len(response.content), 'checked':time.strftime('%Y-%m-%dT%H:%M:%S')}
+        return key, entry, response.content, entry['sha256'] != previous.get('sha256')
+
+    def load(self, contents):
+        with INSTRUMENT('parse'): return json.loads(contents)
+
+    def commit(self, payloads):
+        for key, entry, contents, changed in payloads: self.__manifest.update(key, entry)
+
+    def change(self, query, dataset, *args, file=None, **kwargs):
+        with self.__lock: self.__changed.append({'query':dict(query), 'dataset':dataset, 'file':file})
+
+    def skip(self, query, *args, **kwargs):
+        with self.__lock: self.__unchanged.append({'query':dict(query)})
+
+    def report(self, file=None):
+        with self.__lock: report = {'changed':list(self.__changed), 'unchanged':list(self.__unchanged)}
+        for change in report['changed']: LOGGER.info("Changed: {}|{}|{}".format(change['dataset'], '|'.join(['{}={}'.format(key, value) for key, value in change['query'].items()]), change['file']))
+        LOGGER.info(str(self))
+        if file is None: return report
+        os.makedirs(os.path.dirname(os.path.abspath(file)), exist_ok=True)
+        with open(file, 'w') as contents: json.dump(report, contents, indent=2)
+        return report
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Columnar Storage
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import hashlib
+import threading
+import logging
+from urllib.parse import quote
+
+from uscensus.instrument import INSTRUMENT
+from uscensus.datatypes import numeric_parser
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebStore']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+pd = lazy_module('pandas')
+pa = lazy_module('pyarrow')
+pq = lazy_module('pyarrow.parquet')
+ds = lazy_module('pyarrow.dataset')
+PARTITIONS = ['date', 'state']
+
+
+_partition = lambda key, value: '{}={}'.format(key, quote(str(value), safe=''))
+_hash = lambda value: hashlib.sha1(repr(value).encode('utf-8')).hexdigest()
+_prefix = lambda query: '{}-'.format(_hash(sorted(query.items())))
+_filename = lambda query, part: '{}{}.parquet'.format(_prefix(query), _hash(part))
+_field = lambda column, integers, floats: pa.field(column, pa.int64() if column in integers else pa.float64() if column in floats else pa.string())
+_expression = lambda key, value: ds.field(key).isin([str(item) for item in value]) if isinstance(value, (list, tuple, set)) else ds.field(key) == str(value)
+
+
+def _array(series, field):
+    if pa.types.is_integer(field.type): return pa.array(numeric_parser(series), type=field.type)
+    if pa.types.is_floating(field.type): return pa.array(numeric_parser(series).astype('Float64'), type=field.type)
+    return pa.array(series.astype('string'), type=field.type)
+
+
+class USCensus_WebStore(object):
+    def __init__(self, directory, *args, integers=[], floats=[], **kwargs):
+        self.__directory = directory
+        self.__integers = set(integers)
+        self.__floats = set(floats)
+        self.__schemas = {}
+        self.__partitioning = ds.partitioning(pa.schema([(partition, pa.string()) for partition in PARTITIONS]), flavor='hive')
+        self.__written = set()
+        self.__lock = threading.Lock()
+
+    def __repr__(self): return "{}(directory='{}')".format(self.__class__.__name__, self.__directory)
+    def __contains__(self, dataset): return os.path.isdir(os.path.join(self.__directory, dataset))
+
+    @property
+    def directory(self): return self.__directory
+    @property
+    def datasets(self): return sorted(os.listdir(self.__directory)) if os.path.isdir(self.__directory) else []
+
+    def folder(self, dataset, *args, date, state, **kwargs): return os.path.join(self.__directory, dataset, _partition('date', date), _partition('state', state))
+    def file(self, query, dataset, *args, part=None, **kwargs): return os.path.join(self.folder(dataset, **query), _filename(query, part))
+
+    def schema(self, dataset):
+        try: return self.__schemas[dataset]
+        except KeyError: pass
+        file = os.path.join(self.__directory, dataset, '_schema.arrow')
+        if not os.path.isfile(file): return None
+        with open(file, 'rb') as contents: return self.__schemas.setdefault(dataset, pa.ipc.read_schema(pa.py_buffer(contents.read())))
+
+    def evolve(self, dataset, columns):
+        schema = self.schema(dataset)
+        fields = [_field(column, self.__integers, self.__floats) for column in columns if column not in PARTITIONS and (schema is None or column not in schema.names)]
+        return pa.schema([*(schema if schema is not None else []), *fields])
+
+    def persist(self, dataset, schema):
+        file = os.path.join(self.__directory, dataset, '_schema.arrow')
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        temporary = os.path.join(os.path.dirname(file), '.{}.tmp'.format(os.path.basename(file)))
+        with open(temporary, 'wb') as contents: contents.write(schema.serialize().to_pybytes())
+        os.replace(temporary, file)
+        self.__schemas[dataset] = schema
+
+    def replace(self, query, dataset, *args, **kwargs):
+        folder = self.folder(dataset, **query)
+        if not os.path.isdir(folder): return
+        for file in [file for file in os.listdir(folder) if file.startswith(_prefix(query))]: os.remove(os.path.join(folder, file))
+
+    def append(self, query, dataset, dataframe, *args, part=None, **kwargs):
+        with INSTRUMENT('store', rows=len(dataframe)) as stage:
+            columns = [column for column in dataframe.columns if column not in PARTITIONS]
+            with self.__lock:
+                schema = self.evolve(dataset, columns)
+                table = pa.Table.from_arrays([_array(dataframe[field.name], field) if field.name in columns else pa.nulls(len(dataframe), type=field.type) for field in schema], schema=schema)
+                if schema != self.schema(dataset): self.persist(dataset, schema)
+                if (dataset, _prefix(query)) not in self.__written: self.replace(query, dataset)
+                self.__written.add((dataset, _prefix(query)))
+            file = self.file(query, dataset, part=part)
+            temporary = os.path.join(os.path.dirname(file), '.{}.tmp'.format(os.path.basename(file)))
+            os.makedirs(os.path.dirname(file), exist_ok=True)
+            pq.write_table(table, temporary)
+            os.replace(temporary, file)
+            stage.update(bytes=os.path.getsize(file))
+        return file
+
+    def load(self, dataset, *args, columns=None, filters={}, **kwargs):
+        if dataset not in self: return pd.DataFrame(columns=columns)
+        schema = self.schema(dataset)
+        schema = pa.schema([*schema, *[pa.field(partition, pa.string()) for partition in PARTITIONS]]) if schema is not None else None
+        dataset = ds.dataset(os.path.join(self.__directory, dataset), format='parquet', partitioning=self.__partitioning, schema=schema)
+        expressions = [_expression(key, value) for key, value in filters.items()]
+        expression = None
+        for item in expressions: expression = item if expression is None else expression & item
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
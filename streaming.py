@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   USCensus Streaming Ingestion
+@author: Jack Kirby Cook
+
+"""
+
+import re
+import json
+import logging
+import itertools
+
+from uscensus.instrument import INSTRUMENT
+from uscensus.delayers import retrying_session
+from uscensus.lazy import lazy_module
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['USCensus_WebStream', 'records_parser', 'batches_parser']
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+LOGGER = logging.getLogger(__name__)
+pd = lazy_module('pandas')
+SEPARATORS = re.compile(r'[\s,]*')
+
+
+def records_parser(chunks):
+    decoder, buffer, position, started = json.JSONDecoder(), '', 0, False
+    for chunk in chunks:
+        buffer, position = buffer[position:] + chunk, 0
+        while True:
+            position = SEPARATORS.match(buffer, position).end()
+            if position >= len(buffer): break
+            if not started:
+                if buffer[position] != '[': raise ValueError(buffer[position:position+100])
+                position, started = position + 1, True
+                continue
+            if buffer[position] == ']': return
+            try: row, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError: break
+            yield row
+    if started: raise ValueError('Truncated JSON response')
+
+
+def counted_parser(chunks, stage):
+    for chunk in chunks:
+        stage.update(bytes=len(chunk))
+        yield chunk
+
+
+def batches_parser(rows, size):
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None: return
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch: return
+        yield pd.DataFrame.from_records(batch, columns=header)
+
+
+class USCensus_WebStream(object):
+    def __init__(self, *args, delayer, size=50000, chunksize=2**20, **kwargs):
+        self.__delayer = delayer
+        self.__size = int(size)
+        self.__chunksize = int(chunksize)
+        self.__retrys = kwargs
+        self.__session = None
+
+    def __enter__(self):
+        self.__session = retrying_session(**self.__retrys)
+        return self
+
+    def __exit__(self, *args):
+        self.__session.close()
+        self.__session = None
+
+    def request(self, url):
+        self.__delayer()
+        response = self.__session.get(str(url), stream=True)
+        try: response.raise_for_status()
+        except Exception as error:
+            response.close()
+            raise error
+        return response
+
+    def __call__(self, url, *args, **kwargs):
+        with INSTRUMENT('stream') as stage:
+            response = self.__delayer.attempt(self.request, url)
+            with response:
+                response.encoding = response.encoding or 'utf-8'
+                chunks = counted_parser(response.iter_content(chunk_size=self.__chunksize, decode_unicode=True), stage)
+                for batch in batches_parser(records_parser(chunks), self.__size):
+                    stage.update(rows=len(batch))
+                    yield batch
+
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   USCensus Columnar Storage Tests
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import os.path
+import pytest
+
+DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(DIR, os.pardir, os.pardir))
+if not ROOT_DIR in sys.path: sys.path.append(ROOT_DIR)
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+
+from uscensus.storage import USCensus_WebStore
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__copyright__ = "Copyright 2020, Jack Kirby Cook"
+__license__ = ""
+
+
+QUERY = {'date':2019, 'state':'CA', 'geography':'county'}
+
+
+def test_rejected_append_keeps_stored_data(tmp_path):
+    store = USCensus_WebStore(str(tmp_path), integers=['households'])
+    store.append(QUERY, 'income', pd.DataFrame({'geography':['1', '2'], 'households':['10', '20']}))
+    store = USCensus_WebStore(str(tmp_path), integers=['households'])
+    with pytest.raises((TypeError, ValueError)): store.append(QUERY, 'income', pd.DataFrame({'geography':['1', '2'], 'households':['10.5', '20']}))
+    dataframe = store.load('income')
+    assert list(dataframe['households']) == [10, 20]
+
+
+def test_new_columns_evolve_schema(tmp_path):
+    store = USCensus_WebStore(str(tmp_path), integers=['households'], floats=['income_lower', 'income_upper'])
+    store.append(dict(QUERY, state='NY'), 'income', pd.DataFrame({'geography':['1'], 'households':['10']}))
+    store.append(QUERY, 'income', pd.DataFrame({'geography':['2'], 'households':['20'], 'income_lower':['0'], 'income_upper':['9999']}))
+    dataframe = store.load('income').set_index('state')
+    assert list(store.schema('income').names) == ['geography', 'households', 'income_lower', 'income_upper']
+    assert dataframe.loc['CA', 'income_upper'] == 9999
+    assert pd.isna(dataframe.loc['NY', 'income_lower'])
+    assert USCensus_WebStore(str(tmp_path)).schema('income') == store.schema('income')